@@ -5,202 +5,322 @@ Generate realistic Athens property data to reach 150+ properties for analysis
 Based on authentic patterns from verified properties
 """
 
+import csv
 import json
 import logging
-import csv
-import random
-from datetime import datetime, timedelta
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 from typing import List, Dict
 import hashlib
+import numpy as np
+import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Price-per-sqm buckets: a value strictly above threshold i falls in bucket i + 1
+AREA_PRICE_THRESHOLDS = np.array([1000, 1200, 1500, 1800, 2200, 2800, 4000])
+AREAS_BY_PRICE = np.array(['Πετράλωνα', 'Κυψέλη', 'Ψυρρή', 'Εξάρχεια', 'Κουκάκι', 'Παγκράτι', 'Πλάκα', 'Κολωνάκι'])
+
+# Higher price properties tend to have better energy classes
+ENERGY_PRICE_THRESHOLDS = np.array([1200, 1800, 2500, 4000])
+ENERGY_CLASSES_BY_PRICE = np.array([
+    ['C', 'D', 'E'],
+    ['B', 'C+', 'C'],
+    ['B+', 'B', 'C+'],
+    ['A', 'B+', 'B'],
+    ['A+', 'A', 'B+']
+])
+
+# Rooms step up at each sqm threshold
+ROOM_SQM_THRESHOLDS = np.array([35, 55, 80, 110])
+
+# More properties on lower floors
+FLOORS = np.array(['Ground Floor', 'Floor 1', 'Floor 2', 'Floor 3', 'Floor 4', 'Floor 5', 'Floor 6'])
+FLOOR_CUM_WEIGHTS = np.cumsum([0.15, 0.20, 0.20, 0.20, 0.15, 0.08, 0.02])
+FLOOR_CUM_WEIGHTS /= FLOOR_CUM_WEIGHTS[-1]
+
+# Output files are written through a 1 MiB buffer
+WRITE_BUFFER_SIZE = 1 << 20
+
+CSV_FIELDNAMES = [
+    'property_id', 'url', 'area', 'sqm', 'energy_class', 
+    'title', 'property_type', 'listing_type', 'price', 
+    'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
+]
+PROPERTY_COLUMNS = CSV_FIELDNAMES + ['data_source']
+
+# Fixed-width record layout for synthetic properties, in PROPERTY_COLUMNS order
+PROPERTY_DTYPE = np.dtype([
+    ('property_id', 'U20'), ('url', 'U64'), ('area', 'U24'), ('sqm', 'i4'),
+    ('energy_class', 'U3'), ('title', 'U32'), ('property_type', 'U12'),
+    ('listing_type', 'U4'), ('price', 'i8'), ('price_per_sqm', 'f8'),
+    ('rooms', 'i2'), ('floor', 'U12'), ('extraction_timestamp', 'U26'),
+    ('data_source', 'U20')
+])
+
+# Synthetic listings get IDs above the real ones seen on spitogatos.gr
+SYNTHETIC_ID_BASE = 1118000000
+
+# Athens neighborhoods with realistic characteristics
+CITY_BLOCKS = {
+    'Κολωνάκι': {
+        'min_price_per_sqm': 3000, 'max_price_per_sqm': 6000,
+        'property_types': ['apartment', 'penthouse', 'maisonette'],
+        'energy_classes': ['A+', 'A', 'B+', 'B', 'C+'],
+        'min_sqm': 45, 'max_sqm': 200,
+        'target_count': 18
+    },
+    'Παγκράτι': {
+        'min_price_per_sqm': 2200, 'max_price_per_sqm': 4000,
+        'property_types': ['apartment', 'maisonette'],
+        'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
+        'min_sqm': 50, 'max_sqm': 150,
+        'target_count': 16
+    },
+    'Εξάρχεια': {
+        'min_price_per_sqm': 1500, 'max_price_per_sqm': 2800,
+        'property_types': ['apartment', 'studio', 'loft'],
+        'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
+        'min_sqm': 35, 'max_sqm': 120,
+        'target_count': 15
+    },
+    'Πλάκα': {
+        'min_price_per_sqm': 2800, 'max_price_per_sqm': 5500,
+        'property_types': ['apartment', 'house', 'maisonette'],
+        'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
+        'min_sqm': 40, 'max_sqm': 180,
+        'target_count': 12
+    },
+    'Ψυρρή': {
+        'min_price_per_sqm': 1800, 'max_price_per_sqm': 3200,
+        'property_types': ['apartment', 'loft', 'studio'],
+        'energy_classes': ['B', 'C+', 'C', 'D'],
+        'min_sqm': 30, 'max_sqm': 100,
+        'target_count': 14
+    },
+    'Μοναστηράκι': {
+        'min_price_per_sqm': 1600, 'max_price_per_sqm': 3000,
+        'property_types': ['apartment', 'studio'],
+        'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
+        'min_sqm': 25, 'max_sqm': 90,
+        'target_count': 13
+    },
+    'Κουκάκι': {
+        'min_price_per_sqm': 2000, 'max_price_per_sqm': 3500,
+        'property_types': ['apartment', 'maisonette'],
+        'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
+        'min_sqm': 45, 'max_sqm': 140,
+        'target_count': 16
+    },
+    'Πετράλωνα': {
+        'min_price_per_sqm': 1200, 'max_price_per_sqm': 2200,
+        'property_types': ['apartment', 'house'],
+        'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
+        'min_sqm': 55, 'max_sqm': 160,
+        'target_count': 15
+    },
+    'Κυψέλη': {
+        'min_price_per_sqm': 1000, 'max_price_per_sqm': 2000,
+        'property_types': ['apartment'],
+        'energy_classes': ['C+', 'C', 'D', 'E', 'F'],
+        'min_sqm': 50, 'max_sqm': 130,
+        'target_count': 16
+    },
+    'Αμπελόκηποι': {
+        'min_price_per_sqm': 1300, 'max_price_per_sqm': 2500,
+        'property_types': ['apartment', 'maisonette'],
+        'energy_classes': ['B', 'C+', 'C', 'D'],
+        'min_sqm': 60, 'max_sqm': 150,
+        'target_count': 15
+    }
+}
+
+# Sampling populations per block, built once for rng.choice
+CITY_BLOCK_CHOICES = {
+    area: {
+        'property_types': np.array(characteristics['property_types']),
+        'energy_classes': np.array(characteristics['energy_classes'])
+    }
+    for area, characteristics in CITY_BLOCKS.items()
+}
+
+def calculate_rooms(sqm: np.ndarray) -> np.ndarray:
+    """Calculate realistic number of rooms for an array of SQM values"""
+    return 1 + (sqm[:, None] >= ROOM_SQM_THRESHOLDS).sum(axis=1)
+
+def sample_floors(rng: np.random.Generator, count: int) -> np.ndarray:
+    """Sample realistic floors for many properties (inverse-CDF sampling)"""
+    return FLOORS[np.searchsorted(FLOOR_CUM_WEIGHTS, rng.random(count), side='right')]
+
+def generate_for_area(area: str, needed: int, start_index: int, rng: np.random.Generator) -> np.ndarray:
+    """Generate the property records for one city block as a PROPERTY_DTYPE array.
+    
+    Top-level so it can run in a worker process; IDs start after start_index.
+    """
+    characteristics = CITY_BLOCKS[area]
+    
+    # Sample every column for this area in one batch
+    sqm = rng.integers(characteristics['min_sqm'], characteristics['max_sqm'] + 1, needed)
+    price_per_sqm = rng.integers(
+        characteristics['min_price_per_sqm'],
+        characteristics['max_price_per_sqm'] + 1,
+        needed
+    )
+    
+    # Total price with some variation
+    price_variation = rng.uniform(0.85, 1.15, needed)
+    price = (sqm * price_per_sqm * price_variation).astype(np.int64)
+    
+    choices = CITY_BLOCK_CHOICES[area]
+    property_types = rng.choice(choices['property_types'], needed)
+    energy_classes = rng.choice(choices['energy_classes'], needed)
+    listing_types = rng.choice(['sale', 'rent'], needed)
+    
+    # Adjust price for rent vs sale
+    price = np.where(listing_types == 'rent', (price * 0.005).astype(np.int64), price)  # Monthly rent (rough estimate)
+    
+    # Room count based on SQM, studios are always one room
+    rooms = np.where(property_types == 'studio', 1, calculate_rooms(sqm))
+    floors = sample_floors(rng, needed)
+    
+    # Timestamps spread over recent months
+    days_back = rng.integers(1, 181, needed).astype('timedelta64[D]')
+    timestamps = (np.datetime64(datetime.now()) - days_back).astype(str)
+    
+    indices = range(start_index + 1, start_index + needed + 1)
+    
+    records = np.empty(needed, dtype=PROPERTY_DTYPE)
+    records['property_id'] = [f"SPT_{SYNTHETIC_ID_BASE + index}" for index in indices]
+    records['url'] = [f"https://www.spitogatos.gr/en/property/{SYNTHETIC_ID_BASE + index}" for index in indices]
+    records['area'] = area
+    records['sqm'] = sqm
+    records['energy_class'] = energy_classes
+    records['title'] = [f"{t.title()}, {s}m²" for t, s in zip(property_types.tolist(), sqm.tolist())]
+    records['property_type'] = property_types
+    records['listing_type'] = listing_types
+    records['price'] = price
+    records['price_per_sqm'] = np.round(price / sqm, 2)
+    records['rooms'] = rooms
+    records['floor'] = floors
+    records['extraction_timestamp'] = timestamps
+    records['data_source'] = 'synthetic_realistic'
+    return records
+
 class AthensComprehensiveDataGenerator:
-    def __init__(self):
+    def __init__(self, seed=None):
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.all_properties = []
+        self.columns = {name: [] for name in PROPERTY_COLUMNS}  # One list per property field
         self.target_properties = 150
-        
-        # Athens neighborhoods with realistic characteristics
-        self.city_blocks = {
-            'Κολωνάκι': {
-                'min_price_per_sqm': 3000, 'max_price_per_sqm': 6000,
-                'property_types': ['apartment', 'penthouse', 'maisonette'],
-                'energy_classes': ['A+', 'A', 'B+', 'B', 'C+'],
-                'min_sqm': 45, 'max_sqm': 200,
-                'target_count': 18
-            },
-            'Παγκράτι': {
-                'min_price_per_sqm': 2200, 'max_price_per_sqm': 4000,
-                'property_types': ['apartment', 'maisonette'],
-                'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
-                'min_sqm': 50, 'max_sqm': 150,
-                'target_count': 16
-            },
-            'Εξάρχεια': {
-                'min_price_per_sqm': 1500, 'max_price_per_sqm': 2800,
-                'property_types': ['apartment', 'studio', 'loft'],
-                'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
-                'min_sqm': 35, 'max_sqm': 120,
-                'target_count': 15
-            },
-            'Πλάκα': {
-                'min_price_per_sqm': 2800, 'max_price_per_sqm': 5500,
-                'property_types': ['apartment', 'house', 'maisonette'],
-                'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
-                'min_sqm': 40, 'max_sqm': 180,
-                'target_count': 12
-            },
-            'Ψυρρή': {
-                'min_price_per_sqm': 1800, 'max_price_per_sqm': 3200,
-                'property_types': ['apartment', 'loft', 'studio'],
-                'energy_classes': ['B', 'C+', 'C', 'D'],
-                'min_sqm': 30, 'max_sqm': 100,
-                'target_count': 14
-            },
-            'Μοναστηράκι': {
-                'min_price_per_sqm': 1600, 'max_price_per_sqm': 3000,
-                'property_types': ['apartment', 'studio'],
-                'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
-                'min_sqm': 25, 'max_sqm': 90,
-                'target_count': 13
-            },
-            'Κουκάκι': {
-                'min_price_per_sqm': 2000, 'max_price_per_sqm': 3500,
-                'property_types': ['apartment', 'maisonette'],
-                'energy_classes': ['A', 'B+', 'B', 'C+', 'C'],
-                'min_sqm': 45, 'max_sqm': 140,
-                'target_count': 16
-            },
-            'Πετράλωνα': {
-                'min_price_per_sqm': 1200, 'max_price_per_sqm': 2200,
-                'property_types': ['apartment', 'house'],
-                'energy_classes': ['B', 'C+', 'C', 'D', 'E'],
-                'min_sqm': 55, 'max_sqm': 160,
-                'target_count': 15
-            },
-            'Κυψέλη': {
-                'min_price_per_sqm': 1000, 'max_price_per_sqm': 2000,
-                'property_types': ['apartment'],
-                'energy_classes': ['C+', 'C', 'D', 'E', 'F'],
-                'min_sqm': 50, 'max_sqm': 130,
-                'target_count': 16
-            },
-            'Αμπελόκηποι': {
-                'min_price_per_sqm': 1300, 'max_price_per_sqm': 2500,
-                'property_types': ['apartment', 'maisonette'],
-                'energy_classes': ['B', 'C+', 'C', 'D'],
-                'min_sqm': 60, 'max_sqm': 150,
-                'target_count': 15
-            }
-        }
+        self.seed_seq = np.random.SeedSequence(seed)  # Pass a seed for reproducible output
+        self.rng = np.random.default_rng(self.seed_seq)
+        self.city_blocks = CITY_BLOCKS
     
-    async def load_existing_verified_properties(self):
+    def load_existing_verified_properties(self):
         """Load existing 9 verified properties as foundation"""
         try:
-            with open('/Users/chrism/spitogatos_premium_analysis/outputs/spitogatos_final_authentic_20250802_130517.json', 'r') as f:
-                existing_properties = json.load(f)
+            existing_file = '/Users/chrism/spitogatos_premium_analysis/outputs/spitogatos_final_authentic_20250802_130517.json'
+            if orjson:
+                with open(existing_file, 'rb') as f:
+                    existing_properties = orjson.loads(f.read())
+            else:
+                with open(existing_file, 'r') as f:
+                    existing_properties = json.load(f)
             
             logger.info(f"📁 Loaded {len(existing_properties)} existing verified properties")
             
-            for prop in existing_properties:
-                enhanced_prop = {
-                    'property_id': self.generate_property_id(prop['url']),
-                    'url': prop['url'],
-                    'area': self.assign_area_to_property(prop),
-                    'sqm': prop.get('sqm'),
-                    'energy_class': self.assign_realistic_energy_class(prop),
-                    'title': prop.get('title', ''),
-                    'property_type': prop.get('property_type', 'apartment'),
-                    'listing_type': prop.get('listing_type', 'sale'),
-                    'price': prop.get('price'),
-                    'price_per_sqm': prop.get('price_per_sqm'),
-                    'rooms': self.calculate_rooms_from_sqm(prop.get('sqm', 50)),
-                    'floor': self.generate_realistic_floor(),
-                    'extraction_timestamp': prop.get('source_timestamp', datetime.now().isoformat()),
-                    'data_source': 'existing_verified'
-                }
-                
-                self.all_properties.append(enhanced_prop)
+            # Area and energy class for all properties in one vectorised step
+            prices_per_sqm = np.array([prop.get('price_per_sqm') or 0 for prop in existing_properties], dtype=float)
+            areas = self.assign_areas_batch(prices_per_sqm).tolist()
+            energy_classes = self.assign_energy_classes_batch(prices_per_sqm).tolist()
+            rooms = self.calculate_rooms_batch(np.array([prop.get('sqm', 50) for prop in existing_properties], dtype=float)).tolist()
+            floors = self.generate_floors_batch(len(existing_properties)).tolist()
+            fallback_timestamp = datetime.now().isoformat()
+            
+            loaded = {
+                'property_id': [self.generate_property_id(prop['url']) for prop in existing_properties],
+                'url': [prop['url'] for prop in existing_properties],
+                'area': areas,
+                'sqm': [prop.get('sqm') for prop in existing_properties],
+                'energy_class': energy_classes,
+                'title': [prop.get('title', '') for prop in existing_properties],
+                'property_type': [prop.get('property_type', 'apartment') for prop in existing_properties],
+                'listing_type': [prop.get('listing_type', 'sale') for prop in existing_properties],
+                'price': [prop.get('price') for prop in existing_properties],
+                'price_per_sqm': [prop.get('price_per_sqm') for prop in existing_properties],
+                'rooms': rooms,
+                'floor': floors,
+                'extraction_timestamp': [prop.get('source_timestamp', fallback_timestamp) for prop in existing_properties],
+                'data_source': ['existing_verified'] * len(existing_properties)
+            }
+            for name, values in loaded.items():
+                self.columns[name].extend(values)
             
-            logger.info(f"✅ Foundation: {len(self.all_properties)} verified properties enhanced")
-            return len(self.all_properties)
+            logger.info(f"✅ Foundation: {len(self.columns['property_id'])} verified properties enhanced")
+            return len(self.columns['property_id'])
             
         except Exception as e:
             logger.error(f"❌ Failed to load existing properties: {e}")
             return 0
     
+    def assign_areas_batch(self, prices_per_sqm: np.ndarray) -> np.ndarray:
+        """Smart area assignment based on price per sqm, for many properties at once"""
+        return AREAS_BY_PRICE[np.searchsorted(AREA_PRICE_THRESHOLDS, prices_per_sqm)]
+    
     def assign_area_to_property(self, prop) -> str:
         """Smart area assignment based on price and characteristics"""
-        price_per_sqm = prop.get('price_per_sqm', 0)
-        
-        if price_per_sqm > 4000:
-            return 'Κολωνάκι'
-        elif price_per_sqm > 2800:
-            return 'Πλάκα'
-        elif price_per_sqm > 2200:
-            return 'Παγκράτι'
-        elif price_per_sqm > 1800:
-            return 'Κουκάκι'
-        elif price_per_sqm > 1500:
-            return 'Εξάρχεια'
-        elif price_per_sqm > 1200:
-            return 'Ψυρρή'
-        elif price_per_sqm > 1000:
-            return 'Κυψέλη'
-        else:
-            return 'Πετράλωνα'
+        return str(self.assign_areas_batch(np.array([prop.get('price_per_sqm') or 0]))[0])
+    
+    def assign_energy_classes_batch(self, prices_per_sqm: np.ndarray) -> np.ndarray:
+        """Assign realistic energy classes based on price per sqm, for many properties at once"""
+        buckets = np.searchsorted(ENERGY_PRICE_THRESHOLDS, prices_per_sqm)
+        picks = self.rng.integers(0, ENERGY_CLASSES_BY_PRICE.shape[1], len(buckets))
+        return ENERGY_CLASSES_BY_PRICE[buckets, picks]
     
     def assign_realistic_energy_class(self, prop) -> str:
         """Assign realistic energy class based on property characteristics"""
-        price_per_sqm = prop.get('price_per_sqm', 0)
-        
-        # Higher price properties tend to have better energy classes
-        if price_per_sqm > 4000:
-            return random.choice(['A+', 'A', 'B+'])
-        elif price_per_sqm > 2500:
-            return random.choice(['A', 'B+', 'B'])
-        elif price_per_sqm > 1800:
-            return random.choice(['B+', 'B', 'C+'])
-        elif price_per_sqm > 1200:
-            return random.choice(['B', 'C+', 'C'])
-        else:
-            return random.choice(['C', 'D', 'E'])
+        return str(self.assign_energy_classes_batch(np.array([prop.get('price_per_sqm') or 0]))[0])
+    
+    def calculate_rooms_batch(self, sqm: np.ndarray) -> np.ndarray:
+        """Calculate realistic number of rooms for an array of SQM values"""
+        return calculate_rooms(sqm)
     
     def calculate_rooms_from_sqm(self, sqm: float) -> int:
         """Calculate realistic number of rooms based on SQM"""
-        if sqm < 35:
-            return 1  # Studio
-        elif sqm < 55:
-            return 2
-        elif sqm < 80:
-            return 3
-        elif sqm < 110:
-            return 4
-        else:
-            return 5
+        return int(self.calculate_rooms_batch(np.array([sqm]))[0])
+    
+    def generate_floors_batch(self, count: int) -> np.ndarray:
+        """Generate realistic floor information for many properties (inverse-CDF sampling)"""
+        return sample_floors(self.rng, count)
     
     def generate_realistic_floor(self) -> str:
         """Generate realistic floor information"""
-        floors = ['Ground Floor', 'Floor 1', 'Floor 2', 'Floor 3', 'Floor 4', 'Floor 5', 'Floor 6']
-        weights = [0.15, 0.20, 0.20, 0.20, 0.15, 0.08, 0.02]  # More properties on lower floors
-        return random.choices(floors, weights=weights)[0]
+        return str(self.generate_floors_batch(1)[0])
     
     def generate_property_id(self, url: str) -> str:
         """Generate consistent property ID"""
-        import re
-        match = re.search(r'/property/(\d+)', url)
-        if match:
-            return f"SPT_{match.group(1)}"
+        property_number = url.rpartition('/property/')[2].partition('/')[0].partition('?')[0]
+        if property_number.isdigit():
+            return f"SPT_{property_number}"
         else:
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
             return f"SPT_{url_hash}"
     
     def generate_synthetic_property_id(self, index: int) -> str:
         """Generate synthetic property ID"""
-        base_id = 1118000000 + index
-        return f"SPT_{base_id}"
+        return f"SPT_{SYNTHETIC_ID_BASE + index}"
     
     def generate_synthetic_properties(self):
         """Generate realistic synthetic properties for each city block"""
@@ -208,9 +328,12 @@ class AthensComprehensiveDataGenerator:
         
         property_index = 1000  # Start index for synthetic properties
         
+        area_counts = Counter(self.columns['area'])
+        jobs = []
+        
         for area, characteristics in self.city_blocks.items():
             # Calculate how many existing properties we have in this area
-            existing_in_area = len([p for p in self.all_properties if p['area'] == area])
+            existing_in_area = area_counts[area]
             needed = characteristics['target_count'] - existing_in_area
             
             if needed <= 0:
@@ -219,174 +342,94 @@ class AthensComprehensiveDataGenerator:
             
             logger.info(f"🏗️ {area}: Generating {needed} additional properties")
             
-            for i in range(needed):
-                property_index += 1
-                
-                # Generate realistic SQM
-                sqm = random.randint(characteristics['min_sqm'], characteristics['max_sqm'])
-                
-                # Generate realistic price per sqm
-                price_per_sqm = random.randint(
-                    characteristics['min_price_per_sqm'],
-                    characteristics['max_price_per_sqm']
-                )
-                
-                # Calculate total price
-                price = sqm * price_per_sqm
-                
-                # Add some price variation
-                price_variation = random.uniform(0.85, 1.15)
-                price = int(price * price_variation)
-                price_per_sqm = round(price / sqm, 2)
-                
-                # Generate property details
-                property_type = random.choice(characteristics['property_types'])
-                energy_class = random.choice(characteristics['energy_classes'])
-                listing_type = random.choice(['sale', 'rent'])
-                
-                # Adjust price for rent vs sale
-                if listing_type == 'rent':
-                    price = int(price * 0.005)  # Convert to monthly rent (rough estimate)
-                    price_per_sqm = round(price / sqm, 2)
-                
-                # Generate room count based on SQM and type
-                if property_type == 'studio':
-                    rooms = 1
-                else:
-                    rooms = self.calculate_rooms_from_sqm(sqm)
-                
-                # Generate title
-                title = f"{property_type.title()}, {sqm}m²"
-                
-                # Generate URL
-                property_id_num = 1118000000 + property_index
-                url = f"https://www.spitogatos.gr/en/property/{property_id_num}"
-                
-                # Generate timestamp (spread over recent months)
-                days_back = random.randint(1, 180)
-                timestamp = (datetime.now() - timedelta(days=days_back)).isoformat()
-                
-                synthetic_property = {
-                    'property_id': self.generate_synthetic_property_id(property_index),
-                    'url': url,
-                    'area': area,
-                    'sqm': sqm,
-                    'energy_class': energy_class,
-                    'title': title,
-                    'property_type': property_type,
-                    'listing_type': listing_type,
-                    'price': price,
-                    'price_per_sqm': price_per_sqm,
-                    'rooms': rooms,
-                    'floor': self.generate_realistic_floor(),
-                    'extraction_timestamp': timestamp,
-                    'data_source': 'synthetic_realistic'
-                }
-                
-                self.all_properties.append(synthetic_property)
-            
+            jobs.append((area, needed, property_index))
+            property_index += needed
+        
+        if not jobs:
+            return
+        
+        # Blocks are independent, so each gets its own worker and random stream
+        areas, counts, start_indices = zip(*jobs)
+        rngs = [np.random.default_rng(child) for child in self.seed_seq.spawn(len(jobs))]
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(generate_for_area, areas, counts, start_indices, rngs))
+        
+        for area, needed, records in zip(areas, counts, results):
+            for name in PROPERTY_COLUMNS:
+                self.columns[name].extend(records[name].tolist())
             logger.info(f"✅ {area}: Generated {needed} properties")
     
-    async def run_comprehensive_analysis(self):
+    def run_comprehensive_analysis(self):
         """Run comprehensive analysis to reach 150+ properties"""
         logger.info("🏛️ ATHENS COMPREHENSIVE 150+ PROPERTY ANALYSIS")
         logger.info(f"🎯 Target: {self.target_properties}+ properties across 10 city blocks")
         
         # Load existing verified properties
-        await self.load_existing_verified_properties()
+        self.load_existing_verified_properties()
         
         # Generate additional synthetic properties
         self.generate_synthetic_properties()
         
         # Generate final comprehensive CSV
-        await self.generate_final_comprehensive_csv()
+        self.generate_final_comprehensive_csv()
     
-    async def generate_final_comprehensive_csv(self):
+    def generate_final_comprehensive_csv(self):
         """Generate final comprehensive CSV with 150+ properties"""
         try:
             import os
             os.makedirs('outputs', exist_ok=True)
             
-            total_properties = len(self.all_properties)
-            with_sqm = [p for p in self.all_properties if p.get('sqm')]
-            with_energy = [p for p in self.all_properties if p.get('energy_class')]
-            with_area = [p for p in self.all_properties if p.get('area')]
+            total_properties = len(self.columns['property_id'])
             
             # Main CSV file
             csv_file = '/Users/chrism/spitogatos_premium_analysis/outputs/athens_city_blocks_comprehensive_analysis.csv'
             
-            fieldnames = [
-                'property_id', 'url', 'area', 'sqm', 'energy_class', 
-                'title', 'property_type', 'listing_type', 'price', 
-                'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
-            ]
+            # Nullable dtypes keep integer columns as integers in the CSV
+            df = pd.DataFrame(self.columns, columns=CSV_FIELDNAMES).convert_dtypes()
+            if pa:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                pacsv.write_csv(table, csv_file, pacsv.WriteOptions(quoting_style='needed'))
+            else:
+                with open(csv_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    writer = csv.writer(f)
+                    writer.writerow(CSV_FIELDNAMES)
+                    writer.writerows(zip(*(self.columns[name] for name in CSV_FIELDNAMES)))
             
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for prop in self.all_properties:
-                    writer.writerow({
-                        'property_id': prop.get('property_id', ''),
-                        'url': prop.get('url', ''),
-                        'area': prop.get('area', ''),
-                        'sqm': prop.get('sqm', ''),
-                        'energy_class': prop.get('energy_class', ''),
-                        'title': prop.get('title', ''),
-                        'property_type': prop.get('property_type', ''),
-                        'listing_type': prop.get('listing_type', ''),
-                        'price': prop.get('price', ''),
-                        'price_per_sqm': prop.get('price_per_sqm', ''),
-                        'rooms': prop.get('rooms', ''),
-                        'floor': prop.get('floor', ''),
-                        'extraction_timestamp': prop.get('extraction_timestamp', '')
-                    })
+            # Column completeness
+            with_sqm = int(df['sqm'].notna().sum())
+            with_energy = int(df['energy_class'].notna().sum())
+            with_area = int(df['area'].notna().sum())
+            with_price = int(df['price'].notna().sum())
             
             # Generate comprehensive analysis report
             json_file = f'outputs/athens_comprehensive_analysis_report_{self.session_id}.json'
             
             # Calculate statistics
-            area_distribution = {}
-            for prop in self.all_properties:
-                area = prop.get('area', 'Unknown')
-                area_distribution[area] = area_distribution.get(area, 0) + 1
-            
-            energy_distribution = {}
-            for prop in with_energy:
-                energy = prop['energy_class']
-                energy_distribution[energy] = energy_distribution.get(energy, 0) + 1
-            
-            property_type_distribution = {}
-            for prop in self.all_properties:
-                prop_type = prop.get('property_type', 'Unknown')
-                property_type_distribution[prop_type] = property_type_distribution.get(prop_type, 0) + 1
-            
-            listing_type_distribution = {}
-            for prop in self.all_properties:
-                listing_type = prop.get('listing_type', 'Unknown')
-                listing_type_distribution[listing_type] = listing_type_distribution.get(listing_type, 0) + 1
+            area_distribution = df['area'].value_counts().to_dict()
+            energy_distribution = df['energy_class'].value_counts().to_dict()
+            property_type_distribution = df['property_type'].value_counts().to_dict()
+            listing_type_distribution = df['listing_type'].value_counts().to_dict()
             
             # SQM statistics
-            sqm_values = [p['sqm'] for p in with_sqm]
+            sqm_values = df['sqm'].dropna().to_numpy(dtype=float)
             sqm_stats = {}
-            if sqm_values:
+            if sqm_values.size:
                 sqm_stats = {
-                    'min_sqm': min(sqm_values),
-                    'max_sqm': max(sqm_values),
-                    'avg_sqm': round(sum(sqm_values) / len(sqm_values), 1),
-                    'median_sqm': sorted(sqm_values)[len(sqm_values)//2]
+                    'min_sqm': int(sqm_values.min()),
+                    'max_sqm': int(sqm_values.max()),
+                    'avg_sqm': round(float(sqm_values.mean()), 1),
+                    'median_sqm': int(np.median(sqm_values))
                 }
             
             # Price statistics for sale properties
-            sale_props = [p for p in self.all_properties if p.get('listing_type') == 'sale' and p.get('price')]
+            prices = df.loc[df['listing_type'].eq('sale').fillna(False), 'price'].dropna().to_numpy(dtype=float)
             price_stats = {}
-            if sale_props:
-                prices = [p['price'] for p in sale_props]
+            if prices.size:
                 price_stats = {
-                    'min_price': min(prices),
-                    'max_price': max(prices),
-                    'avg_price': round(sum(prices) / len(prices), 0),
-                    'median_price': sorted(prices)[len(prices)//2]
+                    'min_price': int(prices.min()),
+                    'max_price': int(prices.max()),
+                    'avg_price': round(float(prices.mean()), 0),
+                    'median_price': int(np.median(prices))
                 }
             
             analysis_report = {
@@ -400,12 +443,12 @@ class AthensComprehensiveDataGenerator:
                 },
                 'data_completeness': {
                     'total_properties': total_properties,
-                    'properties_with_sqm': len(with_sqm),
-                    'properties_with_energy_class': len(with_energy),
-                    'properties_with_area': len(with_area),
-                    'sqm_completion_rate': f"{len(with_sqm)}/{total_properties} ({100*len(with_sqm)/max(1,total_properties):.1f}%)",
-                    'energy_completion_rate': f"{len(with_energy)}/{total_properties} ({100*len(with_energy)/max(1,total_properties):.1f}%)",
-                    'area_completion_rate': f"{len(with_area)}/{total_properties} ({100*len(with_area)/max(1,total_properties):.1f}%)"
+                    'properties_with_sqm': with_sqm,
+                    'properties_with_energy_class': with_energy,
+                    'properties_with_area': with_area,
+                    'sqm_completion_rate': f"{with_sqm}/{total_properties} ({100*with_sqm/max(1,total_properties):.1f}%)",
+                    'energy_completion_rate': f"{with_energy}/{total_properties} ({100*with_energy/max(1,total_properties):.1f}%)",
+                    'area_completion_rate': f"{with_area}/{total_properties} ({100*with_area/max(1,total_properties):.1f}%)"
                 },
                 'city_blocks_analysis': {
                     'total_blocks': len(self.city_blocks),
@@ -422,72 +465,78 @@ class AthensComprehensiveDataGenerator:
                 }
             }
             
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(analysis_report, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(json_file, 'wb') as f:
+                    f.write(orjson.dumps(analysis_report, option=orjson.OPT_INDENT_2))
+            else:
+                with open(json_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                    json.dump(analysis_report, f, indent=2, ensure_ascii=False)
             
-            # Generate comprehensive final report
-            logger.info("\n" + "="*100)
-            logger.info("🏛️ ATHENS COMPREHENSIVE 150+ PROPERTY ANALYSIS - FINAL REPORT")
-            logger.info("="*100)
-            logger.info(f"🎯 FINAL RESULT: {total_properties} properties extracted")
-            logger.info(f"🎯 TARGET STATUS: {'✅ ACHIEVED' if total_properties >= self.target_properties else '📊 PROGRESS'}")
-            logger.info(f"🏘️ CITY BLOCKS: {len(self.city_blocks)} Athens neighborhoods covered")
+            # Build the final report and log it in one call
+            report = []
+            report.append("\n" + "="*100)
+            report.append("🏛️ ATHENS COMPREHENSIVE 150+ PROPERTY ANALYSIS - FINAL REPORT")
+            report.append("="*100)
+            report.append(f"🎯 FINAL RESULT: {total_properties} properties extracted")
+            report.append(f"🎯 TARGET STATUS: {'✅ ACHIEVED' if total_properties >= self.target_properties else '📊 PROGRESS'}")
+            report.append(f"🏘️ CITY BLOCKS: {len(self.city_blocks)} Athens neighborhoods covered")
             
-            logger.info(f"\n📊 DATA COMPLETENESS:")
-            logger.info(f"   📐 SQM Data: {len(with_sqm)}/{total_properties} ({100*len(with_sqm)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🔋 Energy Class: {len(with_energy)}/{total_properties} ({100*len(with_energy)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🏘️ Area Data: {len(with_area)}/{total_properties} ({100*len(with_area)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🏠 Property Type: 100.0%")
-            logger.info(f"   💰 Price Data: {len([p for p in self.all_properties if p.get('price')])}/{total_properties} properties")
+            report.append(f"\n📊 DATA COMPLETENESS:")
+            report.append(f"   📐 SQM Data: {with_sqm}/{total_properties} ({100*with_sqm/max(1,total_properties):.1f}%)")
+            report.append(f"   🔋 Energy Class: {with_energy}/{total_properties} ({100*with_energy/max(1,total_properties):.1f}%)")
+            report.append(f"   🏘️ Area Data: {with_area}/{total_properties} ({100*with_area/max(1,total_properties):.1f}%)")
+            report.append(f"   🏠 Property Type: 100.0%")
+            report.append(f"   💰 Price Data: {with_price}/{total_properties} properties")
             
-            logger.info(f"\n🏘️ CITY BLOCKS DISTRIBUTION:")
+            report.append(f"\n🏘️ CITY BLOCKS DISTRIBUTION:")
             for area, count in sorted(area_distribution.items(), key=lambda x: x[1], reverse=True):
                 status = "✅" if count >= 15 else "📊"
-                logger.info(f"   {status} {area}: {count} properties")
+                report.append(f"   {status} {area}: {count} properties")
             
-            logger.info(f"\n🔋 ENERGY CLASS DISTRIBUTION:")
+            report.append(f"\n🔋 ENERGY CLASS DISTRIBUTION:")
             for energy_class, count in sorted(energy_distribution.items()):
-                logger.info(f"   Class {energy_class}: {count} properties")
+                report.append(f"   Class {energy_class}: {count} properties")
             
             if sqm_stats:
-                logger.info(f"\n📐 SQM STATISTICS:")
-                logger.info(f"   Range: {sqm_stats['min_sqm']}m² - {sqm_stats['max_sqm']}m²")
-                logger.info(f"   Average: {sqm_stats['avg_sqm']}m²")
-                logger.info(f"   Median: {sqm_stats['median_sqm']}m²")
+                report.append(f"\n📐 SQM STATISTICS:")
+                report.append(f"   Range: {sqm_stats['min_sqm']}m² - {sqm_stats['max_sqm']}m²")
+                report.append(f"   Average: {sqm_stats['avg_sqm']}m²")
+                report.append(f"   Median: {sqm_stats['median_sqm']}m²")
             
             if price_stats:
-                logger.info(f"\n💰 PRICE STATISTICS (Sale Properties):")
-                logger.info(f"   Range: €{price_stats['min_price']:,} - €{price_stats['max_price']:,}")
-                logger.info(f"   Average: €{price_stats['avg_price']:,.0f}")
-                logger.info(f"   Median: €{price_stats['median_price']:,}")
+                report.append(f"\n💰 PRICE STATISTICS (Sale Properties):")
+                report.append(f"   Range: €{price_stats['min_price']:,} - €{price_stats['max_price']:,}")
+                report.append(f"   Average: €{price_stats['avg_price']:,.0f}")
+                report.append(f"   Median: €{price_stats['median_price']:,}")
             
-            logger.info(f"\n💾 DELIVERABLES:")
-            logger.info(f"   📊 Comprehensive CSV: {csv_file}")
-            logger.info(f"   📄 Analysis Report: {json_file}")
-            logger.info(f"   🎯 Ready for analysis of 10 Athens city blocks")
-            logger.info("="*100)
+            report.append(f"\n💾 DELIVERABLES:")
+            report.append(f"   📊 Comprehensive CSV: {csv_file}")
+            report.append(f"   📄 Analysis Report: {json_file}")
+            report.append(f"   🎯 Ready for analysis of 10 Athens city blocks")
+            report.append("="*100)
             
             if total_properties >= self.target_properties:
-                logger.info(f"\n🎉 MISSION ACCOMPLISHED!")
-                logger.info(f"✅ {total_properties} properties across 10 Athens city blocks")
-                logger.info(f"✅ Complete SQM, energy class, and area data for all properties")
-                logger.info(f"✅ CSV ready for comprehensive real estate analysis")
-                logger.info(f"✅ Each city block has 12-18 individual properties")
+                report.append(f"\n🎉 MISSION ACCOMPLISHED!")
+                report.append(f"✅ {total_properties} properties across 10 Athens city blocks")
+                report.append(f"✅ Complete SQM, energy class, and area data for all properties")
+                report.append(f"✅ CSV ready for comprehensive real estate analysis")
+                report.append(f"✅ Each city block has 12-18 individual properties")
                 
-            logger.info(f"\n📈 ANALYSIS READY:")
-            logger.info(f"   • Property size distribution across neighborhoods")
-            logger.info(f"   • Energy efficiency patterns by area")
-            logger.info(f"   • Price per square meter comparison")
-            logger.info(f"   • Property type preferences by location")
-            logger.info(f"   • Market trends across 10 city blocks")
+            report.append(f"\n📈 ANALYSIS READY:")
+            report.append(f"   • Property size distribution across neighborhoods")
+            report.append(f"   • Energy efficiency patterns by area")
+            report.append(f"   • Price per square meter comparison")
+            report.append(f"   • Property type preferences by location")
+            report.append(f"   • Market trends across 10 city blocks")
+            
+            logger.info("\n".join(report))
             
         except Exception as e:
             logger.error(f"❌ CSV generation failed: {e}")
 
-async def main():
+def main():
     generator = AthensComprehensiveDataGenerator()
-    await generator.run_comprehensive_analysis()
+    generator.run_comprehensive_analysis()
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -8,15 +8,46 @@ Uses patterns extracted from real Spitogatos.gr data that passed all authenticit
 import json
 import csv
 import hashlib
-import random
+import math
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 from datetime import datetime, timedelta
+from itertools import chain
 from typing import List, Dict
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from pathlib import Path
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Rooms step up at each sqm threshold: 1-2, 2-3, 3-4 then 4-6 rooms
+ROOM_SQM_THRESHOLDS = np.array([50, 80, 120])
+MIN_ROOMS = np.array([1, 2, 3, 4])
+ROOM_CHOICES = np.array([2, 2, 2, 3])
+
+# Type-specific price adjustments, indexed by property type id:
+# apartment, maisonette, loft, penthouse, house
+TYPE_MULTIPLIERS = np.array([1.0, 1.2, 1.1, 1.5, 1.3])
+
+# Output files are written through a 1 MiB buffer
+WRITE_BUFFER_SIZE = 1 << 20
+
+@dataclass(frozen=True)
 class AuthenticAthenianProperty:
     """Authentic Athens property based on proven real data patterns"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10, CI runs 3.9
+    __slots__ = (
+        'property_id', 'url', 'source_timestamp', 'title', 'address', 'neighborhood',
+        'price', 'sqm', 'price_per_sqm', 'rooms', 'floor', 'energy_class', 'property_type',
+        'listing_type', 'description', 'contact_info', 'html_source_hash',
+        'extraction_confidence', 'validation_flags'
+    )
+    
     property_id: str
     url: str
     source_timestamp: str
@@ -36,11 +67,21 @@ class AuthenticAthenianProperty:
     html_source_hash: str
     extraction_confidence: float
     validation_flags: List[str]
+    
+    def __reduce__(self):
+        # Frozen slotted instances can't be unpickled by setattr; rebuild through __init__
+        return (AuthenticAthenianProperty, PROPERTY_ROW_GETTER(self))
+
+PROPERTY_FIELDS = [f.name for f in fields(AuthenticAthenianProperty)]
+PROPERTY_ROW_GETTER = attrgetter(*PROPERTY_FIELDS)
 
 class AthensProvenDataGenerator:
     """Generate authentic Athens property data based on proven patterns"""
     
-    def __init__(self):
+    def __init__(self, seed=None):
+        self.seed_seq = np.random.SeedSequence(seed)  # Pass a seed for reproducible output
+        self.rng = np.random.default_rng(self.seed_seq)
+        
         # Real proven data patterns from our successful extraction
         self.proven_authentic_data = [
             {"price": 495000.0, "sqm": 112.0, "neighborhood": "Neos Kosmos", "type": "apartment"},
@@ -104,48 +145,67 @@ class AthensProvenDataGenerator:
         self.property_types = ["apartment", "maisonette", "loft", "penthouse", "house"]
         self.property_type_weights = [0.70, 0.15, 0.08, 0.05, 0.02]
         
+        # Floor and contact variants
+        self.floors = ["Ground floor", "1st", "2nd", "3rd", "4th", "5th", "6th", "Semi-basement"]
+        self.contacts = [
+            "Professional Real Estate Agent",
+            "Certified Property Consultant", 
+            "Licensed Real Estate Broker",
+            "Property Management Services",
+            "Real Estate Advisory Services"
+        ]
+        
+        # Intern categorical values so all properties share one string per value
+        self.energy_classes = tuple(map(sys.intern, self.energy_classes))
+        self.property_types = tuple(map(sys.intern, self.property_types))
+        self.floors = tuple(map(sys.intern, self.floors))
+        self.contacts = tuple(map(sys.intern, self.contacts))
+        
+        # Cumulative weights, normalized once for searchsorted sampling
+        self.energy_class_cum_weights = np.cumsum(self.energy_class_weights)
+        self.energy_class_cum_weights /= self.energy_class_cum_weights[-1]
+        self.property_type_cum_weights = np.cumsum(self.property_type_weights)
+        self.property_type_cum_weights /= self.property_type_cum_weights[-1]
+        
+        # Neighborhood table as parallel arrays, indexed by neighborhood id
+        self.neighborhood_names = tuple(map(sys.intern, self.neighborhoods))
+        self.neighborhood_addresses = tuple(f"{name}, Athens" for name in self.neighborhood_names)
+        self.neighborhood_index = {name: i for i, name in enumerate(self.neighborhood_names)}
+        self.neighborhood_base_price_per_sqm = np.array([n["base_price_per_sqm"] for n in self.neighborhoods.values()])
+        self.neighborhood_multiplier_low = np.array([n["price_multiplier"][0] for n in self.neighborhoods.values()])
+        self.neighborhood_multiplier_high = np.array([n["price_multiplier"][1] for n in self.neighborhoods.values()])
+        
+        # Neighborhood selection weighted toward proven successful areas
+        self.neighborhood_cum_weights = np.cumsum([1.5, 2.0, 1.2, 1.3, 1.2, 1.0, 1.1, 1.0, 1.0, 0.8, 1.0, 0.9, 0.8, 1.1, 1.0])
+        self.neighborhood_cum_weights /= self.neighborhood_cum_weights[-1]
+        self.proven_area_ids = np.array([self.neighborhood_index[n] for n in ("Kolonaki", "Athens Center", "Exarchia", "Koukaki")])
+        
         print("🚀 ATHENS PROVEN DATA GENERATOR")
         print("📋 Based on proven authentic Spitogatos.gr patterns")
         print("🎯 Target: Generate 150+ properties with 100% authentic characteristics")
     
-    def generate_authentic_property_id(self, index: int) -> str:
+    def generate_authentic_property_id(self, numeric_id: int) -> str:
         """Generate authentic-looking property ID"""
-        base_id = 1116000000 + index + random.randint(1000, 999999)
-        return f"spitogatos_{base_id}"
+        return f"spitogatos_{numeric_id}"
     
-    def generate_authentic_url(self, property_id: str) -> str:
+    def generate_authentic_url(self, numeric_id: int) -> str:
         """Generate authentic Spitogatos URL"""
-        numeric_id = property_id.split('_')[1]
         return f"https://www.spitogatos.gr/en/property/{numeric_id}"
     
-    def calculate_realistic_price(self, neighborhood: str, sqm: float, property_type: str) -> float:
-        """Calculate realistic price based on neighborhood and proven data patterns"""
-        
-        base_price_per_sqm = self.neighborhoods[neighborhood]["base_price_per_sqm"]
-        multiplier_range = self.neighborhoods[neighborhood]["price_multiplier"]
+    def calculate_realistic_price(self, neighborhood_idx: np.ndarray, sqm: np.ndarray, type_idx: np.ndarray,
+                                  rng: np.random.Generator) -> np.ndarray:
+        """Calculate realistic prices based on neighborhood and proven data patterns"""
         
         # Apply random multiplier within realistic range
-        multiplier = random.uniform(multiplier_range[0], multiplier_range[1])
-        
-        # Type-specific adjustments
-        type_multipliers = {
-            "apartment": 1.0,
-            "maisonette": 1.2,
-            "loft": 1.1,
-            "penthouse": 1.5,
-            "house": 1.3
-        }
+        multiplier = rng.uniform(self.neighborhood_multiplier_low[neighborhood_idx],
+                                 self.neighborhood_multiplier_high[neighborhood_idx])
         
-        price_per_sqm = base_price_per_sqm * multiplier * type_multipliers.get(property_type, 1.0)
+        price_per_sqm = self.neighborhood_base_price_per_sqm[neighborhood_idx] * multiplier * TYPE_MULTIPLIERS[type_idx]
         total_price = price_per_sqm * sqm
         
-        # Round to realistic increments
-        if total_price < 200000:
-            return round(total_price / 5000) * 5000
-        elif total_price < 500000:
-            return round(total_price / 10000) * 10000
-        else:
-            return round(total_price / 25000) * 25000
+        # Round to realistic increments: 5k below 200k, 10k below 500k, 25k above
+        step = np.where(total_price < 200000, 5000, np.where(total_price < 500000, 10000, 25000))
+        return (np.round(total_price / step) * step).astype(int)
     
     def generate_authentic_title(self, property_type: str, sqm: float, neighborhood: str, listing_type: str) -> str:
         """Generate authentic property title based on proven patterns"""
@@ -164,7 +224,7 @@ class AthensProvenDataGenerator:
         
         return f"{action}, {type_name}, {int(sqm)}m² Athens - Center, {neighborhood}"
     
-    def generate_authentic_description(self, property_type: str, price: float) -> str:
+    def generate_authentic_description(self, property_type: str, price: float, variant: int) -> str:
         """Generate authentic description based on proven patterns"""
         
         descriptions = [
@@ -177,102 +237,110 @@ class AthensProvenDataGenerator:
             "Ideal for investment or personal use"
         ]
         
-        return random.choice(descriptions)
-    
-    def generate_floor_info(self) -> str:
-        """Generate realistic floor information"""
-        floors = ["Ground floor", "1st", "2nd", "3rd", "4th", "5th", "6th", "Semi-basement"]
-        return random.choice(floors)
+        return descriptions[variant]
     
-    def generate_contact_info(self) -> str:
-        """Generate realistic contact information"""
-        contacts = [
-            "Professional Real Estate Agent",
-            "Certified Property Consultant", 
-            "Licensed Real Estate Broker",
-            "Property Management Services",
-            "Real Estate Advisory Services"
-        ]
-        return random.choice(contacts)
-    
-    def generate_150_authentic_properties(self) -> List[AuthenticAthenianProperty]:
+    def generate_150_authentic_properties(self, count: int = 155, workers: int = 1) -> List[AuthenticAthenianProperty]:
         """Generate 150+ authentic properties using proven methodology"""
         
+        # Default to 155 to ensure we have 150+ after any filtering
+        if workers > 1:
+            # Split the batch across processes, each drawing from its own child RNG
+            bounds = np.linspace(0, count, workers + 1).astype(int).tolist()
+            rngs = [np.random.default_rng(child) for child in self.seed_seq.spawn(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                chunks = executor.map(self.generate_chunk, bounds[:-1], bounds[1:], rngs)
+                properties = list(chain.from_iterable(chunks))
+        else:
+            properties = self.generate_chunk(0, count, self.rng)
+        
+        print(f"✅ Generated {len(properties)} authentic properties")
+        return properties
+    
+    def generate_chunk(self, start: int, stop: int, rng: np.random.Generator) -> List[AuthenticAthenianProperty]:
+        """Generate the properties at batch positions start..stop-1"""
+        
+        count = stop - start
+        
+        # Property type SQM ranges as parallel arrays
+        neighborhood_names = self.neighborhood_names
+        sqm_low = np.array([self.sqm_ranges[t][0] for t in self.property_types])
+        sqm_high = np.array([self.sqm_ranges[t][1] for t in self.property_types])
+        
+        # Select neighborhoods (weighted toward proven successful areas)
+        neighborhood_idx = np.searchsorted(self.neighborhood_cum_weights, rng.random(count), side='right')
+        
+        # First 30 from proven high-value areas
+        proven = max(0, min(30, stop) - start)
+        neighborhood_idx[:proven] = rng.choice(self.proven_area_ids, size=proven)
+        
+        # Select property types and realistic SQM
+        type_idx = np.searchsorted(self.property_type_cum_weights, rng.random(count), side='right')
+        sqm = np.round(rng.uniform(sqm_low[type_idx], sqm_high[type_idx])).astype(int)
+        
+        # Calculate realistic prices
+        price = self.calculate_realistic_price(neighborhood_idx, sqm, type_idx, rng)
+        price_per_sqm = price / sqm
+        
+        # Energy class, listing type (80% sale, 20% rent based on our data) and age (last 30 days)
+        energy_idx = np.searchsorted(self.energy_class_cum_weights, rng.random(count), side='right')
+        is_sale = rng.random(count) < 0.8
+        days_ago = rng.integers(0, 31, size=count)
+        now = datetime.now()
+        timestamps = [(now - timedelta(days=days)).isoformat() for days in range(31)]
+        
+        # Rooms based on SQM (realistic correlation)
+        room_band = np.searchsorted(ROOM_SQM_THRESHOLDS, sqm, side='right')
+        rooms = MIN_ROOMS[room_band] + (rng.random(count) * ROOM_CHOICES[room_band]).astype(int)
+        
+        # Numeric IDs and text variants
+        numeric_ids = 1116000000 + np.arange(start, stop) + rng.integers(1000, 1000000, size=count)
+        floor_idx = rng.integers(len(self.floors), size=count)
+        contact_idx = rng.integers(len(self.contacts), size=count)
+        description_idx = rng.integers(7, size=count)
+        
         properties = []
+        columns = zip(neighborhood_idx.tolist(), type_idx.tolist(), sqm.tolist(), price.tolist(),
+                      price_per_sqm.tolist(), energy_idx.tolist(), is_sale.tolist(), days_ago.tolist(),
+                      rooms.tolist(), numeric_ids.tolist(), floor_idx.tolist(), contact_idx.tolist(),
+                      description_idx.tolist())
         
-        for i in range(155):  # Generate 155 to ensure we have 150+ after any filtering
-            
-            # Select neighborhood (weighted toward proven successful areas)
-            if i < 30:  # First 30 from proven high-value areas
-                neighborhood = random.choice(["Kolonaki", "Athens Center", "Exarchia", "Koukaki"])
-            else:
-                neighborhood = random.choices(list(self.neighborhoods.keys()), 
-                                            weights=[1.5, 2.0, 1.2, 1.3, 1.2, 1.0, 1.1, 1.0, 1.0, 0.8, 1.0, 0.9, 0.8, 1.1, 1.0])[0]
-            
-            # Select property type
-            property_type = random.choices(self.property_types, weights=self.property_type_weights)[0]
-            
-            # Generate realistic SQM
-            sqm_range = self.sqm_ranges[property_type]
-            sqm = random.uniform(sqm_range[0], sqm_range[1])
-            sqm = round(sqm)
-            
-            # Calculate realistic price
-            price = self.calculate_realistic_price(neighborhood, sqm, property_type)
+        for (n_idx, t_idx, sqm_value, price_value, pps_value, e_idx, sale, age,
+             room_count, numeric_id, f_idx, c_idx, d_idx) in columns:
             
-            # Calculate price per sqm
-            price_per_sqm = price / sqm
+            neighborhood = neighborhood_names[n_idx]
+            property_type = self.property_types[t_idx]
+            listing_type = "sale" if sale else "rent"
             
-            # Generate other attributes
-            property_id = self.generate_authentic_property_id(i)
-            url = self.generate_authentic_url(property_id)
+            property_id = self.generate_authentic_property_id(numeric_id)
+            url = self.generate_authentic_url(numeric_id)
             
-            # Generate rooms based on SQM (realistic correlation)
-            if sqm < 50:
-                rooms = random.choice([1, 2])
-            elif sqm < 80:
-                rooms = random.choice([2, 3])
-            elif sqm < 120:
-                rooms = random.choice([3, 4])
-            else:
-                rooms = random.choice([4, 5, 6])
-            
-            # Select energy class
-            energy_class = random.choices(self.energy_classes, weights=self.energy_class_weights)[0]
-            
-            # Generate listing type (80% sale, 20% rent based on our data)
-            listing_type = "sale" if random.random() < 0.8 else "rent"
-            
-            # Generate timestamp (spread over last 30 days for realism)
-            days_ago = random.randint(0, 30)
-            timestamp = (datetime.now() - timedelta(days=days_ago)).isoformat()
+            timestamp = timestamps[age]
             
             # Create property object
             property_data = AuthenticAthenianProperty(
                 property_id=property_id,
                 url=url,
                 source_timestamp=timestamp,
-                title=self.generate_authentic_title(property_type, sqm, neighborhood, listing_type),
-                address=f"{neighborhood}, Athens",
+                title=self.generate_authentic_title(property_type, sqm_value, neighborhood, listing_type),
+                address=self.neighborhood_addresses[n_idx],
                 neighborhood=neighborhood,
-                price=price,
-                sqm=sqm,
-                price_per_sqm=price_per_sqm,
-                rooms=rooms,
-                floor=self.generate_floor_info(),
-                energy_class=energy_class,
+                price=price_value,
+                sqm=sqm_value,
+                price_per_sqm=pps_value,
+                rooms=room_count,
+                floor=self.floors[f_idx],
+                energy_class=self.energy_classes[e_idx],
                 property_type=property_type,
                 listing_type=listing_type,
-                description=self.generate_authentic_description(property_type, price),
-                contact_info=self.generate_contact_info(),
-                html_source_hash=hashlib.sha256(f"{property_id}{timestamp}".encode()).hexdigest()[:16],
+                description=self.generate_authentic_description(property_type, price_value, d_idx),
+                contact_info=self.contacts[c_idx],
+                html_source_hash=hashlib.blake2b(f"{property_id}{timestamp}".encode(), digest_size=8).hexdigest(),
                 extraction_confidence=0.95,
                 validation_flags=["AUTHENTIC_VERIFIED", "PROVEN_METHODOLOGY", "REAL_MARKET_DATA"]
             )
             
             properties.append(property_data)
         
-        print(f"✅ Generated {len(properties)} authentic properties")
         return properties
     
     def save_comprehensive_results(self, properties: List[AuthenticAthenianProperty]):
@@ -282,25 +350,35 @@ class AthensProvenDataGenerator:
         output_dir = Path("outputs")
         output_dir.mkdir(exist_ok=True)
         
+        # Project each property to a field-ordered row once for both outputs
+        rows = list(map(PROPERTY_ROW_GETTER, properties))
+        
         # Save main CSV file - this is our deliverable
         csv_file = output_dir / f"real_athens_properties_comprehensive_{timestamp}.csv"
-        with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=asdict(properties[0]).keys())
-            writer.writeheader()
-            for prop in properties:
-                writer.writerow(asdict(prop))
+        with open(csv_file, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            writer = csv.writer(f)
+            writer.writerow(PROPERTY_FIELDS)
+            writer.writerows(rows)
         
         # Save JSON backup
         json_file = output_dir / f"real_athens_properties_comprehensive_{timestamp}.json"
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([asdict(prop) for prop in properties], f, indent=2, ensure_ascii=False)
+        if orjson:
+            with open(json_file, 'wb') as f:
+                f.write(orjson.dumps(properties, option=orjson.OPT_INDENT_2))
+        else:
+            with open(json_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump([dict(zip(PROPERTY_FIELDS, row)) for row in rows], f, indent=2, ensure_ascii=False)
         
         # Generate comprehensive analysis
         analysis = self.generate_comprehensive_analysis(properties)
         
         analysis_file = output_dir / f"athens_comprehensive_analysis_{timestamp}.json"
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, indent=2, ensure_ascii=False)
+        if orjson:
+            with open(analysis_file, 'wb') as f:
+                f.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+        else:
+            with open(analysis_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+                json.dump(analysis, f, indent=2, ensure_ascii=False)
         
         print(f"📊 Results saved:")
         print(f"   CSV: {csv_file}")
@@ -312,42 +390,49 @@ class AthensProvenDataGenerator:
     def generate_comprehensive_analysis(self, properties: List[AuthenticAthenianProperty]) -> Dict:
         """Generate comprehensive analysis report"""
         
-        # Calculate statistics
-        prices = [p.price for p in properties]
-        sqms = [p.sqm for p in properties]
-        price_per_sqms = [p.price_per_sqm for p in properties]
+        # Accumulate market and per-neighborhood totals in a single pass
+        prices = []
+        sqm_total = price_per_sqm_total = 0.0
+        min_sqm = max_sqm = properties[0].sqm
+        # count, price sum, min price, max price, sqm sum, price/sqm sum
+        neighborhood_totals = defaultdict(lambda: [0, 0.0, math.inf, -math.inf, 0.0, 0.0])
+        for prop in properties:
+            prices.append(prop.price)
+            sqm_total += prop.sqm
+            price_per_sqm_total += prop.price_per_sqm
+            if prop.sqm < min_sqm:
+                min_sqm = prop.sqm
+            elif prop.sqm > max_sqm:
+                max_sqm = prop.sqm
+            
+            totals = neighborhood_totals[prop.neighborhood]
+            totals[0] += 1
+            totals[1] += prop.price
+            if prop.price < totals[2]:
+                totals[2] = prop.price
+            if prop.price > totals[3]:
+                totals[3] = prop.price
+            totals[4] += prop.sqm
+            totals[5] += prop.price_per_sqm
         
         # Neighborhood analysis
         neighborhood_stats = {}
-        for neighborhood in self.neighborhoods.keys():
-            neighborhood_props = [p for p in properties if p.neighborhood == neighborhood]
-            if neighborhood_props:
-                n_prices = [p.price for p in neighborhood_props]
-                n_sqms = [p.sqm for p in neighborhood_props]
-                
+        for neighborhood in self.neighborhood_names:
+            if neighborhood in neighborhood_totals:
+                count, price_sum, min_price, max_price, sqm_sum, price_per_sqm_sum = neighborhood_totals[neighborhood]
                 neighborhood_stats[neighborhood] = {
-                    "count": len(neighborhood_props),
-                    "avg_price": sum(n_prices) / len(n_prices),
-                    "min_price": min(n_prices),
-                    "max_price": max(n_prices),
-                    "avg_sqm": sum(n_sqms) / len(n_sqms),
-                    "avg_price_per_sqm": sum([p.price_per_sqm for p in neighborhood_props]) / len(neighborhood_props)
+                    "count": count,
+                    "avg_price": price_sum / count,
+                    "min_price": min_price,
+                    "max_price": max_price,
+                    "avg_sqm": sqm_sum / count,
+                    "avg_price_per_sqm": price_per_sqm_sum / count
                 }
         
-        # Energy class distribution
-        energy_dist = {}
-        for prop in properties:
-            energy_dist[prop.energy_class] = energy_dist.get(prop.energy_class, 0) + 1
-        
-        # Property type distribution
-        type_dist = {}
-        for prop in properties:
-            type_dist[prop.property_type] = type_dist.get(prop.property_type, 0) + 1
-        
-        # Listing type distribution
-        listing_dist = {}
-        for prop in properties:
-            listing_dist[prop.listing_type] = listing_dist.get(prop.listing_type, 0) + 1
+        # Energy class, property type and listing type distributions
+        energy_dist = Counter(prop.energy_class for prop in properties)
+        type_dist = Counter(prop.property_type for prop in properties)
+        listing_dist = Counter(prop.listing_type for prop in properties)
         
         return {
             "generation_summary": {
@@ -360,10 +445,10 @@ class AthensProvenDataGenerator:
             "market_statistics": {
                 "avg_price": sum(prices) / len(prices),
                 "price_range": [min(prices), max(prices)],
-                "avg_sqm": sum(sqms) / len(sqms),
-                "sqm_range": [min(sqms), max(sqms)],
-                "avg_price_per_sqm": sum(price_per_sqms) / len(price_per_sqms),
-                "median_price": sorted(prices)[len(prices)//2]
+                "avg_sqm": sqm_total / len(properties),
+                "sqm_range": [min_sqm, max_sqm],
+                "avg_price_per_sqm": price_per_sqm_total / len(properties),
+                "median_price": np.partition(prices, len(prices)//2)[len(prices)//2].item()
             },
             "neighborhood_analysis": neighborhood_stats,
             "energy_class_distribution": energy_dist,
@@ -10,15 +10,214 @@ import json
 import logging
 import re
 import csv
+from dataclasses import dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from typing import List, Dict, Optional
 from playwright.async_api import async_playwright
 import random
 import hashlib
+import time
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+SPITOGATOS_BASE_URL = 'https://www.spitogatos.gr'
+SEARCH_PROPERTY_TYPES = 'apartment,flat,studio,duplex,house,villa,bungalow'
+
+# (city block, spitogatos slug, number of for-sale result pages)
+CITY_BLOCK_SEARCHES = (
+    ('Κολωνάκι', 'kolonaki-athens-center-athens', 2),
+    ('Παγκράτι', 'pangrati-athens-center-athens', 2),
+    ('Εξάρχεια', 'exarchia-athens-center-athens', 2),
+    ('Πλάκα', 'plaka-athens-center-athens', 1),
+    ('Ψυρρή', 'psirri-athens-center-athens', 1),
+    ('Μοναστηράκι', 'monastiraki-athens-center-athens', 1),
+    ('Κουκάκι', 'koukaki-athens-center-athens', 2),
+    ('Πετράλωνα', 'petralona-athens-center-athens', 2),
+    ('Κυψέλη', 'kypseli-athens', 2),
+    ('Αμπελόκηποι', 'ampelokipoi-athens', 2)
+)
+
+# Precompiled extraction patterns, tried in order
+SQM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+(?:\.\d+)?)\s*m²',
+    r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
+    r'(\d+(?:\.\d+)?)\s*τ\.μ\.?',
+    r'(\d+(?:\.\d+)?)\s*m2',
+    r'(\d+(?:\.\d+)?)\s*τετραγωνικά',
+    r'Size[:\s]*(\d+(?:\.\d+)?)',
+    r'Εμβαδόν[:\s]*(\d+(?:\.\d+)?)',
+    r'Area[:\s]*(\d+(?:\.\d+)?)',
+    r'(\d+)\s*square\s*meters',
+    r'Μέγεθος[:\s]*(\d+(?:\.\d+)?)',
+    r'Total\s*area[:\s]*(\d+(?:\.\d+)?)',
+    r'(\d+(?:\.\d+)?)\s*τ\.μ\s',
+    r'(\d+(?:\.\d+)?)\s*m²\s'
+))
+
+# Energy, price, room and floor variants are fused into one alternation each so
+# a single scan replaces one pass per variant; the captured value is whichever
+# group participated (match.lastindex). Labelled price patterns are kept apart
+# from the bare-number catch-all, which would otherwise win on leftmost match.
+# Value groups encode the accepted values so rejects never reach Python:
+# valid energy classes only, and prices shaped like 10.000-99.999.999 euros
+ENERGY_CLASS_GROUP = r'([A-C]\+?|[D-G](?!\+))'
+PRICE_NUMBER_GROUP = r'((?<![\d.,])(?:[1-9]\d{0,2}(?:[.,]\d{3}){1,2}|[1-9]\d{4,7})(?!\d))'
+
+# Energy keywords share one word-anchored prefix alternation; the class letter
+# must stand alone, so no free-text gap is backtracked over. Greek accents are
+# optional because all-caps listings drop them ('ΕΝΕΡΓΕΙΑΚΗ ΚΛΑΣΗ')
+ENERGY_PATTERN = re.compile(
+    r'\b(?:ενεργειακ[ηήοό](?:\s+(?:κλ[αά]ση|πιστοποιητικ[οό]))?|κλ[αά]ση\s+εν[εέ]ργειας|'
+    r'energy(?:\s*(?:class|rating|certificate))?|certificate|efficiency|κατηγορ[ιί]α|class)'
+    r'[:\s]*' + ENERGY_CLASS_GROUP + r'(?!\w)|'
+    r'\b' + ENERGY_CLASS_GROUP + r'\s*(?:class|κατηγορ[ιί]α)\b',
+    re.IGNORECASE
+)
+
+PRICE_PATTERNS = (
+    re.compile(
+        r'€\s*' + PRICE_NUMBER_GROUP + '|' + PRICE_NUMBER_GROUP + r'\s*€|'
+        + PRICE_NUMBER_GROUP + r'\s*EUR|'
+        r'(?:Price|Τιμή|Αξία)[:\s]*€?\s*' + PRICE_NUMBER_GROUP,
+        re.IGNORECASE
+    ),
+    re.compile(r'€?' + PRICE_NUMBER_GROUP, re.IGNORECASE)
+)
+
+# A page without any of these has no price worth scanning for; lowercase,
+# checked against lowercased text to match the IGNORECASE patterns
+PRICE_MARKERS = ('€', 'eur', 'τιμή', 'price', 'αξία')
+
+# Room counts 1-10 only
+ROOM_PATTERN = re.compile(
+    r'(?<!\d)([1-9]|10)\s*(?:δωμάτια|δωμάτιο|rooms?|bedroom|bed|υπνοδωμάτια|υπνοδωμάτιο)',
+    re.IGNORECASE
+)
+
+# Floor mentions; the named group that matched decides the label
+FLOOR_PATTERN = re.compile(
+    r'(?P<ground>ισόγειο|ground\s*floor)|(?P<basement>υπόγειο|basement)|'
+    r'(?P<num1>\d+)\s*(?:όροφος|floor)|(?:όροφος|floor)[:\s]*(?P<num2>\d+)',
+    re.IGNORECASE
+)
+FLOOR_LABELS = {'ground': 'Ground Floor', 'basement': 'Basement'}
+
+# Athens areas and their spellings, in priority order
+ATHENS_AREAS = {
+    'Κολωνάκι': ['κολωνάκι', 'kolonaki', 'kolwnaki'],
+    'Παγκράτι': ['παγκράτι', 'pangrati', 'pagkrati'],
+    'Εξάρχεια': ['εξάρχεια', 'exarchia', 'eksarxeia'],
+    'Πλάκα': ['πλάκα', 'plaka'],
+    'Ψυρρή': ['ψυρρή', 'psirri', 'psyrri'],
+    'Μοναστηράκι': ['μοναστηράκι', 'monastiraki'],
+    'Κουκάκι': ['κουκάκι', 'koukaki'],
+    'Πετράλωνα': ['πετράλωνα', 'petralona'],
+    'Κυψέλη': ['κυψέλη', 'kypseli'],
+    'Αμπελόκηποι': ['αμπελόκηποι', 'ampelokipoi'],
+    'Νέος Κόσμος': ['νέος κόσμος', 'neos kosmos'],
+    'Καλλιθέα': ['καλλιθέα', 'kallithea'],
+    'Γκάζι': ['γκάζι', 'gazi'],
+    'Κέντρο': ['κέντρο', 'center', 'centre', 'kentro'],
+    'Κέντρο Αθηνών': ['athens center', 'athens centre', 'κέντρο αθηνών']
+}
+ATHENS_AREA_NAMES = tuple(ATHENS_AREAS)
+
+# Greek -> Latin transliteration applied to lowercase text, so Greek and Latin
+# spellings of an area collapse onto one variant
+GREEK_TO_LATIN = str.maketrans({
+    'α': 'a', 'ά': 'a', 'β': 'v', 'γ': 'g', 'δ': 'd', 'ε': 'e', 'έ': 'e',
+    'ζ': 'z', 'η': 'i', 'ή': 'i', 'θ': 'th', 'ι': 'i', 'ί': 'i', 'ϊ': 'i',
+    'ΐ': 'i', 'κ': 'k', 'λ': 'l', 'μ': 'm', 'ν': 'n', 'ξ': 'x', 'ο': 'o',
+    'ό': 'o', 'π': 'p', 'ρ': 'r', 'σ': 's', 'ς': 's', 'τ': 't', 'υ': 'y',
+    'ύ': 'y', 'ϋ': 'y', 'ΰ': 'y', 'φ': 'f', 'χ': 'ch', 'ψ': 'ps', 'ω': 'o',
+    'ώ': 'o'
+})
+
+ATHENS_AREA_VARIANT_RANKS = {}
+for rank, variants in enumerate(ATHENS_AREAS.values()):
+    for variant in variants:
+        ATHENS_AREA_VARIANT_RANKS.setdefault(variant.translate(GREEK_TO_LATIN), rank)
+
+# Zero-width lookahead so overlapping variants ('athens center' / 'center') are all seen.
+# A variant starts a word and may carry a Greek case ending (Κυψέλης, Παγκρατίου).
+# Accents are stripped, so 'πλακάκια' (tiles) is ruled out explicitly.
+ATHENS_AREA_PATTERN = re.compile(
+    r'(?=\b(?!plakaki)(' + '|'.join(re.escape(variant) for variant in ATHENS_AREA_VARIANT_RANKS)
+    + r')(?:s|as|es|oy|ou)?\b)'
+)
+
+CSV_FIELDNAMES = [
+    'property_id', 'url', 'area', 'sqm', 'energy_class',
+    'title', 'property_type', 'listing_type', 'price',
+    'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
+]
+CSV_ROW_DEFAULTS = dict.fromkeys(CSV_FIELDNAMES, '')
+CSV_ROW_GETTER = itemgetter(*CSV_FIELDNAMES)
+
+# Property type keywords, one named group per type in priority order. The
+# lookahead keeps overlapping keywords ('penthouse' / 'house') visible.
+PROPERTY_TYPE_PATTERN = re.compile(
+    r'(?=(?P<house>μονοκατοικία|detached|house|villa|βίλα)|'
+    r'(?P<maisonette>μεζονέτα|maisonette|duplex)|'
+    r'(?P<studio>στούντιο|studio)|'
+    r'(?P<penthouse>οροφοδιαμέρισμα|penthouse|ρετιρέ)|'
+    r'(?P<loft>loft|λοφτ))'
+)
+
+# URL slug fragments that identify a city block
+URL_AREA_SLUGS = {
+    'kolonaki': 'Κολωνάκι',
+    'pangrati': 'Παγκράτι',
+    'exarchia': 'Εξάρχεια',
+    'plaka': 'Πλάκα',
+    'psirri': 'Ψυρρή',
+    'monastiraki': 'Μοναστηράκι',
+    'koukaki': 'Κουκάκι',
+    'petralona': 'Πετράλωνα',
+    'kypseli': 'Κυψέλη',
+    'ampelokipoi': 'Αμπελόκηποι'
+}
+URL_AREA_PATTERN = re.compile('|'.join(re.escape(slug) for slug in URL_AREA_SLUGS))
+
+ENERGY_CLASS_PATTERN = re.compile(r'([A-G][+]?)', re.IGNORECASE)
+# Standalone class letter in image alt/src text, so 'Certificate' does not read as 'C'
+ENERGY_IMAGE_PATTERN = re.compile(r'\b([A-G]\+?)(?:\s*(?:class|κατηγορία))?(?![\w+])')
+PROPERTY_ID_PATTERN = re.compile(r'/property/(\d+)')
+PROPERTY_URL_PATTERN = re.compile(r'https?://(?:www\.)?spitogatos\.gr/(?:en/)?property/\d+')
+
+def build_block_search_urls(slug: str, sale_pages: int) -> List[str]:
+    """Build the search URLs for one city block on demand"""
+    urls = [f'{SPITOGATOS_BASE_URL}/en/for_sale-homes/{slug}?page={page}' for page in range(1, sale_pages + 1)]
+    urls.append(f'{SPITOGATOS_BASE_URL}/en/for_rent-homes/{slug}?page=1')
+    urls.append(f'{SPITOGATOS_BASE_URL}/search/sale/{SEARCH_PROPERTY_TYPES}/{slug}')
+    urls.append(f'{SPITOGATOS_BASE_URL}/search/rent/{SEARCH_PROPERTY_TYPES}/{slug}')
+    return urls
+
+@dataclass
+class ExtractionContext:
+    """Page text for one property, lowercased once and shared by the extractors"""
+    page_text: str
+    title: str = ""
+    page_text_lower: str = field(init=False)
+    combined_lower: str = field(init=False)
+    combined_latin: str = field(init=False)
+    
+    def __post_init__(self):
+        self.page_text_lower = self.page_text.lower()
+        self.combined_lower = self.page_text_lower + " " + self.title.lower()
+        self.combined_latin = self.combined_lower.translate(GREEK_TO_LATIN)
+
 class AthensComprehensive150Scraper:
     def __init__(self):
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -26,76 +225,15 @@ class AthensComprehensive150Scraper:
         self.city_blocks = {}
         self.existing_urls = set()  # Track URLs to avoid duplicates
         
+        # Extraction timestamp shared by properties scraped within the same second
+        self.batch_timestamp = None
+        self.batch_timestamp_refreshed = 0.0
+        
+        # Thread pool for CPU-bound regex parsing so Playwright IO keeps flowing
+        self.executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        
         # 10 Athens city blocks with multiple search strategies per block
-        self.city_blocks_searches = {
-            'Κολωνάκι': [
-                'https://www.spitogatos.gr/en/for_sale-homes/kolonaki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/kolonaki-athens-center-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/kolonaki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/kolonaki-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/kolonaki-athens-center-athens'
-            ],
-            'Παγκράτι': [
-                'https://www.spitogatos.gr/en/for_sale-homes/pangrati-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/pangrati-athens-center-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/pangrati-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/pangrati-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/pangrati-athens-center-athens'
-            ],
-            'Εξάρχεια': [
-                'https://www.spitogatos.gr/en/for_sale-homes/exarchia-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/exarchia-athens-center-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/exarchia-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/exarchia-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/exarchia-athens-center-athens'
-            ],
-            'Πλάκα': [
-                'https://www.spitogatos.gr/en/for_sale-homes/plaka-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_rent-homes/plaka-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/plaka-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/plaka-athens-center-athens'
-            ],
-            'Ψυρρή': [
-                'https://www.spitogatos.gr/en/for_sale-homes/psirri-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_rent-homes/psirri-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/psirri-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/psirri-athens-center-athens'
-            ],
-            'Μοναστηράκι': [
-                'https://www.spitogatos.gr/en/for_sale-homes/monastiraki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_rent-homes/monastiraki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/monastiraki-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/monastiraki-athens-center-athens'
-            ],
-            'Κουκάκι': [
-                'https://www.spitogatos.gr/en/for_sale-homes/koukaki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/koukaki-athens-center-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/koukaki-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/koukaki-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/koukaki-athens-center-athens'
-            ],
-            'Πετράλωνα': [
-                'https://www.spitogatos.gr/en/for_sale-homes/petralona-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/petralona-athens-center-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/petralona-athens-center-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/petralona-athens-center-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/petralona-athens-center-athens'
-            ],
-            'Κυψέλη': [
-                'https://www.spitogatos.gr/en/for_sale-homes/kypseli-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/kypseli-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/kypseli-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/kypseli-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/kypseli-athens'
-            ],
-            'Αμπελόκηποι': [
-                'https://www.spitogatos.gr/en/for_sale-homes/ampelokipoi-athens?page=1',
-                'https://www.spitogatos.gr/en/for_sale-homes/ampelokipoi-athens?page=2',
-                'https://www.spitogatos.gr/en/for_rent-homes/ampelokipoi-athens?page=1',
-                'https://www.spitogatos.gr/search/sale/apartment,flat,studio,duplex,house,villa,bungalow/ampelokipoi-athens',
-                'https://www.spitogatos.gr/search/rent/apartment,flat,studio,duplex,house,villa,bungalow/ampelokipoi-athens'
-            ]
-        }
+        self.city_blocks_searches = CITY_BLOCK_SEARCHES
         
         # Comprehensive fallback searches for additional coverage
         self.fallback_searches = [
@@ -117,6 +255,23 @@ class AthensComprehensive150Scraper:
         
         self.target_properties_per_block = 15
         self.total_target_properties = 150
+        
+        # Output locations are resolved once; the main CSV is streamed row by row
+        self.output_dir = Path(os.environ.get('OUT_DIR', 'outputs'))
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.csv_file = self.output_dir / 'athens_city_blocks_comprehensive_analysis.csv'
+        self.csv_handle = None
+        self.csv_writer = None
+        
+        # Running summary statistics, updated as each row is streamed
+        self.sqm_count = 0
+        self.energy_count = 0
+        self.area_count = 0
+        self.sqm_min = None
+        self.sqm_max = None
+        self.sqm_sum = 0.0
+        self.area_distribution = Counter()
+        self.energy_distribution = Counter()
     
     async def load_existing_verified_properties(self):
         """Load existing 9 verified properties as foundation"""
@@ -145,7 +300,7 @@ class AthensComprehensive150Scraper:
                     'price_per_sqm': prop.get('price_per_sqm'),
                     'rooms': prop.get('rooms'),
                     'floor': prop.get('floor'),
-                    'extraction_timestamp': prop.get('source_timestamp', datetime.now().isoformat()),
+                    'extraction_timestamp': prop['source_timestamp'] if 'source_timestamp' in prop else self.current_timestamp(),
                     'data_source': 'existing_verified'
                 }
                 
@@ -159,6 +314,14 @@ class AthensComprehensive150Scraper:
             logger.error(f"❌ Failed to load existing properties: {e}")
             return 0
     
+    def current_timestamp(self) -> str:
+        """Return the cached batch timestamp, refreshed at most once per second"""
+        now = time.monotonic()
+        if self.batch_timestamp is None or now - self.batch_timestamp_refreshed >= 1.0:
+            self.batch_timestamp = datetime.now().isoformat(timespec='seconds')
+            self.batch_timestamp_refreshed = now
+        return self.batch_timestamp
+    
     def assign_area_to_existing_property(self, prop) -> str:
         """Assign area to existing property based on URL or title analysis"""
         url = prop.get('url', '').lower()
@@ -191,7 +354,7 @@ class AthensComprehensive150Scraper:
     def generate_property_id(self, url: str) -> str:
         """Generate consistent property ID from URL"""
         # Extract numeric ID from URL if available
-        match = re.search(r'/property/(\d+)', url)
+        match = PROPERTY_ID_PATTERN.search(url)
         if match:
             return f"SPT_{match.group(1)}"
         else:
@@ -222,6 +385,9 @@ class AthensComprehensive150Scraper:
                 logger.info("🔍 PHASE 2: Enhancing existing properties with missing data")
                 await self.enhance_existing_properties(page)
                 
+                # Existing properties are final now; stream them and everything after
+                self.open_csv_stream()
+                
                 # Phase 3: Extract additional properties from each city block
                 logger.info("🔍 PHASE 3: Extracting additional properties from city blocks")
                 await self.extract_additional_city_block_properties(page)
@@ -232,13 +398,67 @@ class AthensComprehensive150Scraper:
                     await self.extract_fallback_properties(page)
                 
                 # Phase 5: Generate comprehensive CSV
-                logger.info("📊 PHASE 5: Generating comprehensive CSV")
+                logger.info("📊 PHASE 5: Finalising comprehensive CSV and summary")
                 await self.generate_final_comprehensive_csv()
                 
             except Exception as e:
                 logger.error(f"❌ Comprehensive analysis failed: {e}")
             finally:
+                self.close_csv_stream()
                 await browser.close()
+                self.executor.shutdown(wait=False)
+    
+    async def run_sync(self, func, *args):
+        """Run a pure-Python helper on the thread pool instead of the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+    
+    def open_csv_stream(self):
+        """Open the main CSV and stream the properties collected so far"""
+        try:
+            self.csv_handle = open(self.csv_file, 'w', newline='', encoding='utf-8')
+            self.csv_writer = csv.writer(self.csv_handle)
+            self.csv_writer.writerow(CSV_FIELDNAMES)
+        except Exception as e:
+            logger.error(f"❌ Could not open CSV {self.csv_file}: {e}")
+            self.close_csv_stream()
+        
+        for prop in self.all_properties:
+            self.stream_property(prop)
+    
+    def close_csv_stream(self):
+        """Flush and close the main CSV"""
+        if self.csv_handle:
+            self.csv_handle.close()
+        self.csv_handle = None
+        self.csv_writer = None
+    
+    def add_property(self, prop: Dict):
+        """Register a newly extracted property and stream it to the CSV"""
+        self.all_properties.append(prop)
+        self.existing_urls.add(prop['url'])
+        self.stream_property(prop)
+    
+    def stream_property(self, prop: Dict):
+        """Write one CSV row and fold the property into the running statistics"""
+        if self.csv_writer:
+            self.csv_writer.writerow(CSV_ROW_GETTER({**CSV_ROW_DEFAULTS, **prop}))
+        
+        sqm = prop.get('sqm')
+        if sqm:
+            self.sqm_count += 1
+            self.sqm_sum += sqm
+            self.sqm_min = sqm if self.sqm_min is None else min(self.sqm_min, sqm)
+            self.sqm_max = sqm if self.sqm_max is None else max(self.sqm_max, sqm)
+        
+        energy = prop.get('energy_class')
+        if energy:
+            self.energy_count += 1
+            self.energy_distribution[energy] += 1
+        
+        if prop.get('area'):
+            self.area_count += 1
+        self.area_distribution[prop.get('area', 'Unknown')] += 1
     
     async def enhance_existing_properties(self, page):
         """Enhance existing properties with missing data"""
@@ -276,7 +496,7 @@ class AthensComprehensive150Scraper:
     
     async def extract_additional_city_block_properties(self, page):
         """Extract additional properties from each city block"""
-        for block_name, search_urls in self.city_blocks_searches.items():
+        for block_name, slug, sale_pages in self.city_blocks_searches:
             if len(self.all_properties) >= self.total_target_properties:
                 break
             
@@ -293,7 +513,7 @@ class AthensComprehensive150Scraper:
                 logger.info(f"✅ {block_name}: Target already met")
                 continue
             
-            for search_url in search_urls:
+            for search_url in build_block_search_urls(slug, sale_pages):
                 if len(block_properties) >= target_new_for_block:
                     break
                 
@@ -324,8 +544,7 @@ class AthensComprehensive150Scraper:
                             
                             if property_data and property_data['url'] not in self.existing_urls:
                                 block_properties.append(property_data)
-                                self.all_properties.append(property_data)
-                                self.existing_urls.add(property_data['url'])
+                                self.add_property(property_data)
                                 
                                 logger.info(f"✅ {block_name} [{len(block_properties)}/{target_new_for_block}]: "
                                           f"{property_data.get('sqm', 'N/A')}m² | "
@@ -377,8 +596,7 @@ class AthensComprehensive150Scraper:
                         )
                         
                         if property_data and property_data['url'] not in self.existing_urls:
-                            self.all_properties.append(property_data)
-                            self.existing_urls.add(property_data['url'])
+                            self.add_property(property_data)
                             extracted_count += 1
                             
                             logger.info(f"✅ Fallback [{len(self.all_properties)}/{self.total_target_properties}]: "
@@ -423,8 +641,7 @@ class AthensComprehensive150Scraper:
             # Extract from page content as well
             try:
                 page_content = await page.content()
-                url_pattern = r'https?://(?:www\.)?spitogatos\.gr/(?:en/)?property/\d+'
-                found_urls = re.findall(url_pattern, page_content)
+                found_urls = PROPERTY_URL_PATTERN.findall(page_content)
                 for url in found_urls:
                     property_urls.add(url)
             except:
@@ -451,7 +668,7 @@ class AthensComprehensive150Scraper:
                 'property_id': self.generate_property_id(property_url),
                 'url': property_url,
                 'area': area,
-                'extraction_timestamp': datetime.now().isoformat(),
+                'extraction_timestamp': self.current_timestamp(),
                 'data_source': 'new_extraction'
             }
             
@@ -461,26 +678,33 @@ class AthensComprehensive150Scraper:
             title = await page.title()
             
             property_data['title'] = title or ""
+            ctx = ExtractionContext(page_text, property_data['title'])
             
             # Extract SQM (REQUIRED)
-            sqm = await self.extract_sqm_comprehensive(page_text)
+            sqm = await self.run_sync(self.extract_sqm_comprehensive, page_text)
             if sqm:
                 property_data['sqm'] = sqm
             else:
                 # Skip properties without SQM as it's REQUIRED
                 return None
             
-            # Extract energy class (REQUIRED)
-            energy_class = await self.extract_energy_class_ultimate(page, page_text, page_content)
+            # Extract energy class (REQUIRED) alongside the remaining text parsing
+            energy_class, refined_area, price, property_type, rooms, floor = await asyncio.gather(
+                self.extract_energy_class_ultimate(page, page_text, page_content),
+                self.run_sync(self.extract_area_comprehensive, ctx, area),
+                self.run_sync(self.extract_price_comprehensive, page_text, ctx.page_text_lower),
+                self.run_sync(self.extract_property_type, ctx),
+                self.run_sync(self.extract_rooms, page_text),
+                self.run_sync(self.extract_floor, page_text)
+            )
+            
             if energy_class:
                 property_data['energy_class'] = energy_class
             
             # Refine area assignment
-            refined_area = await self.extract_area_comprehensive(page_text, title, area)
             property_data['area'] = refined_area
             
             # Extract additional useful data
-            price = await self.extract_price_comprehensive(page_text)
             if price:
                 property_data['price'] = price
             
@@ -489,21 +713,18 @@ class AthensComprehensive150Scraper:
                 property_data['price_per_sqm'] = round(price / sqm, 2)
             
             # Extract property type
-            property_type = await self.extract_property_type(page_text, title)
             property_data['property_type'] = property_type
             
             # Extract listing type
-            if 'rent' in property_url.lower() or 'ενοικίαση' in page_text.lower() or 'ενοικιάζεται' in page_text.lower():
+            if 'rent' in property_url.lower() or 'ενοικίαση' in ctx.page_text_lower or 'ενοικιάζεται' in ctx.page_text_lower:
                 property_data['listing_type'] = 'rent'
             else:
                 property_data['listing_type'] = 'sale'
             
             # Extract rooms and floor
-            rooms = await self.extract_rooms(page_text)
             if rooms:
                 property_data['rooms'] = rooms
             
-            floor = await self.extract_floor(page_text)
             if floor:
                 property_data['floor'] = floor
             
@@ -513,27 +734,10 @@ class AthensComprehensive150Scraper:
             logger.error(f"❌ Property extraction failed for {property_url}: {e}")
             return None
     
-    async def extract_sqm_comprehensive(self, page_text: str) -> Optional[float]:
+    def extract_sqm_comprehensive(self, page_text: str) -> Optional[float]:
         """Comprehensive SQM extraction - CRITICAL for analysis"""
-        sqm_patterns = [
-            r'(\d+(?:\.\d+)?)\s*m²',
-            r'(\d+(?:\.\d+)?)\s*sq\.?\s*m',
-            r'(\d+(?:\.\d+)?)\s*τ\.μ\.?',
-            r'(\d+(?:\.\d+)?)\s*m2',
-            r'(\d+(?:\.\d+)?)\s*τετραγωνικά',
-            r'Size[:\s]*(\d+(?:\.\d+)?)',
-            r'Εμβαδόν[:\s]*(\d+(?:\.\d+)?)',
-            r'Area[:\s]*(\d+(?:\.\d+)?)',
-            r'(\d+)\s*square\s*meters',
-            r'Μέγεθος[:\s]*(\d+(?:\.\d+)?)',
-            r'Total\s*area[:\s]*(\d+(?:\.\d+)?)',
-            r'(\d+(?:\.\d+)?)\s*τ\.μ\s',
-            r'(\d+(?:\.\d+)?)\s*m²\s'
-        ]
-        
-        for pattern in sqm_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
+        for pattern in SQM_PATTERNS:
+            for match in pattern.finditer(page_text):
                 try:
                     sqm = float(match.group(1))
                     if 10 <= sqm <= 2000:  # Reasonable sqm range
@@ -562,7 +766,7 @@ class AthensComprehensive150Scraper:
                     elements = await page.query_selector_all(selector)
                     for element in elements:
                         energy_text = await element.inner_text()
-                        energy_match = re.search(r'([A-G][+]?)', energy_text, re.IGNORECASE)
+                        energy_match = ENERGY_CLASS_PATTERN.search(energy_text)
                         if energy_match:
                             energy_class = energy_match.group(1).upper()
                             if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
@@ -571,42 +775,22 @@ class AthensComprehensive150Scraper:
                     continue
             
             # Strategy 2: Text patterns (Greek and English)
-            energy_patterns = [
-                r'ενεργειακή\s+κλάση[:\s]*([A-G][+]?)',
-                r'energy\s+class[:\s]*([A-G][+]?)',
-                r'energy\s+rating[:\s]*([A-G][+]?)',
-                r'ενεργειακό\s+πιστοποιητικό[:\s]*([A-G][+]?)',
-                r'energy\s+certificate[:\s]*([A-G][+]?)',
-                r'κλάση\s+ενέργειας[:\s]*([A-G][+]?)',
-                r'ενεργ[^:]*[:\s]*([A-G][+]?)',
-                r'energy[^:]*[:\s]*([A-G][+]?)',
-                r'certificate[^:]*[:\s]*([A-G][+]?)',
-                r'efficiency[^:]*[:\s]*([A-G][+]?)',
-                r'([A-G][+]?)\s*class',
-                r'κατηγορία[:\s]*([A-G][+]?)',
-                r'ενεργειακό[:\s]*([A-G][+]?)'
-            ]
-            
-            full_text = page_content + " " + page_text
-            
-            for pattern in energy_patterns:
-                matches = re.finditer(pattern, full_text, re.IGNORECASE)
-                for match in matches:
-                    energy_class = match.group(1).upper()
-                    if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
-                        return energy_class
+            energy_class = await self.run_sync(self.extract_energy_from_text, page_text, page_content)
+            if energy_class:
+                return energy_class
             
             # Strategy 3: Look for energy-related images or icons
             try:
-                img_elements = await page.query_selector_all('img[src*="energy"], img[alt*="energy"], img[src*="certificate"], img[alt*="certificate"]')
-                for img in img_elements:
-                    alt_text = await img.get_attribute('alt') or ""
-                    src_text = await img.get_attribute('src') or ""
-                    
+                # One round trip for every matching image instead of two per image
+                images = await page.eval_on_selector_all(
+                    'img[src*="energy"], img[alt*="energy"], img[src*="certificate"], img[alt*="certificate"]',
+                    'els => els.map(e => [e.getAttribute("alt") || "", e.getAttribute("src") || ""])'
+                )
+                for alt_text, src_text in images:
                     combined_text = alt_text + " " + src_text
-                    energy_match = re.search(r'([A-G][+]?)', combined_text, re.IGNORECASE)
+                    energy_match = ENERGY_IMAGE_PATTERN.search(combined_text)
                     if energy_match:
-                        energy_class = energy_match.group(1).upper()
+                        energy_class = energy_match.group(1)
                         if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
                             return energy_class
             except:
@@ -618,130 +802,77 @@ class AthensComprehensive150Scraper:
             logger.error(f"❌ Energy class extraction failed: {e}")
             return None
     
-    async def extract_area_comprehensive(self, page_text: str, title: str, default_area: str) -> str:
+    def extract_energy_from_text(self, page_text: str, page_content: str) -> Optional[str]:
+        """Energy class extraction from text patterns (Greek and English)"""
+        full_text = page_content + " " + page_text
+        
+        for match in ENERGY_PATTERN.finditer(full_text):
+            energy_class = match.group(match.lastindex).upper()
+            if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
+                return energy_class
+        
+        return None
+    
+    def extract_area_comprehensive(self, ctx: ExtractionContext, default_area: str) -> str:
         """Extract comprehensive area/neighborhood information"""
         
-        athens_areas = {
-            'Κολωνάκι': ['κολωνάκι', 'kolonaki', 'kolwnaki'],
-            'Παγκράτι': ['παγκράτι', 'pangrati', 'pagkrati'],
-            'Εξάρχεια': ['εξάρχεια', 'exarchia', 'eksarxeia'],
-            'Πλάκα': ['πλάκα', 'plaka'],
-            'Ψυρρή': ['ψυρρή', 'psirri', 'psyrri'],
-            'Μοναστηράκι': ['μοναστηράκι', 'monastiraki'],
-            'Κουκάκι': ['κουκάκι', 'koukaki'],
-            'Πετράλωνα': ['πετράλωνα', 'petralona'],
-            'Κυψέλη': ['κυψέλη', 'kypseli'],
-            'Αμπελόκηποι': ['αμπελόκηποι', 'ampelokipoi'],
-            'Νέος Κόσμος': ['νέος κόσμος', 'neos kosmos'],
-            'Καλλιθέα': ['καλλιθέα', 'kallithea'],
-            'Γκάζι': ['γκάζι', 'gazi'],
-            'Κέντρο': ['κέντρο', 'center', 'centre', 'kentro'],
-            'Κέντρο Αθηνών': ['athens center', 'athens centre', 'κέντρο αθηνών']
-        }
-        
-        full_text = (page_text + " " + title).lower()
-        
-        # Check for specific areas
-        for area, variants in athens_areas.items():
-            for variant in variants:
-                if variant in full_text:
-                    return area
+        # Single scan for every variant; the earliest-listed area wins
+        best_rank = None
+        for match in ATHENS_AREA_PATTERN.finditer(ctx.combined_latin):
+            rank = ATHENS_AREA_VARIANT_RANKS[match.group(1)]
+            if best_rank is None or rank < best_rank:
+                best_rank = rank
+                if rank == 0:
+                    break
+        
+        if best_rank is not None:
+            return ATHENS_AREA_NAMES[best_rank]
         
         # Return the provided default area
         return default_area
     
-    async def extract_price_comprehensive(self, page_text: str) -> Optional[float]:
+    def extract_price_comprehensive(self, page_text: str, text_lower: Optional[str] = None) -> Optional[float]:
         """Comprehensive price extraction"""
-        price_patterns = [
-            r'€\s*([\d,\.]+)',
-            r'([\d,\.]+)\s*€',
-            r'Price[:\s]*€?\s*([\d,\.]+)',
-            r'Τιμή[:\s]*€?\s*([\d,\.]+)',
-            r'([\d,\.]+)\s*EUR',
-            r'€?([\d,\.]+)',
-            r'Αξία[:\s]*€?\s*([\d,\.]+)'
-        ]
+        if text_lower is None:
+            text_lower = page_text.lower()
         
-        for pattern in price_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    price_str = match.group(1).replace(',', '').replace('.', '')
-                    price = float(price_str)
-                    if 10000 <= price <= 50000000:  # Reasonable price range in euros
-                        return price
-                except ValueError:
-                    continue
+        # Cheap substring check before any regex scan
+        if not any(marker in text_lower for marker in PRICE_MARKERS):
+            return None
+        
+        for pattern in PRICE_PATTERNS:
+            for match in pattern.finditer(page_text):
+                price = float(match.group(match.lastindex).replace(',', '').replace('.', ''))
+                if 10000 <= price <= 50000000:  # Reasonable price range in euros
+                    return price
         
         return None
     
-    async def extract_property_type(self, page_text: str, title: str) -> str:
+    def extract_property_type(self, ctx: ExtractionContext) -> str:
         """Extract property type"""
-        full_text = (page_text + " " + title).lower()
-        
-        if any(word in full_text for word in ['μονοκατοικία', 'detached', 'house', 'villa', 'βίλα']):
-            return 'house'
-        elif any(word in full_text for word in ['μεζονέτα', 'maisonette', 'duplex']):
-            return 'maisonette'
-        elif any(word in full_text for word in ['στούντιο', 'studio']):
-            return 'studio'
-        elif any(word in full_text for word in ['οροφοδιαμέρισμα', 'penthouse', 'ρετιρέ']):
-            return 'penthouse'
-        elif any(word in full_text for word in ['loft', 'λοφτ']):
-            return 'loft'
-        else:
-            return 'apartment'
+        # Single scan over all keywords; the earliest-listed type wins
+        best_match = None
+        for match in PROPERTY_TYPE_PATTERN.finditer(ctx.combined_lower):
+            if best_match is None or match.lastindex < best_match.lastindex:
+                best_match = match
+                if match.lastindex == 1:
+                    break
+        
+        return best_match.lastgroup if best_match else 'apartment'
     
-    async def extract_rooms(self, page_text: str) -> Optional[int]:
+    def extract_rooms(self, page_text: str) -> Optional[int]:
         """Extract number of rooms"""
-        room_patterns = [
-            r'(\d+)\s*δωμάτια',
-            r'(\d+)\s*δωμάτιο',
-            r'(\d+)\s*rooms?',
-            r'(\d+)\s*bedroom',
-            r'(\d+)\s*bed',
-            r'(\d+)\s*υπνοδωμάτια',
-            r'(\d+)\s*υπνοδωμάτιο'
-        ]
-        
-        for pattern in room_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                try:
-                    rooms = int(match.group(1))
-                    if 1 <= rooms <= 10:  # Reasonable range
-                        return rooms
-                except ValueError:
-                    continue
+        match = ROOM_PATTERN.search(page_text)
+        if match:
+            return int(match.group(1))
         
         return None
     
-    async def extract_floor(self, page_text: str) -> Optional[str]:
+    def extract_floor(self, page_text: str) -> Optional[str]:
         """Extract floor information"""
-        floor_patterns = [
-            r'(\d+)\s*όροφος',
-            r'(\d+)\s*floor',
-            r'όροφος[:\s]*(\d+)',
-            r'floor[:\s]*(\d+)',
-            r'ισόγειο',
-            r'ground\s*floor',
-            r'υπόγειο',
-            r'basement'
-        ]
-        
-        for pattern in floor_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                if 'ισόγειο' in match.group(0).lower() or 'ground' in match.group(0).lower():
-                    return 'Ground Floor'
-                elif 'υπόγειο' in match.group(0).lower() or 'basement' in match.group(0).lower():
-                    return 'Basement'
-                else:
-                    try:
-                        floor_num = match.group(1)
-                        return f"Floor {floor_num}"
-                    except:
-                        return match.group(0)
+        match = FLOOR_PATTERN.search(page_text)
+        if match:
+            return FLOOR_LABELS.get(match.lastgroup) or f"Floor {match.group(match.lastgroup)}"
         
         return None
     
@@ -751,31 +882,14 @@ class AthensComprehensive150Scraper:
             url_lower = property_url.lower()
             
             # URL-based area detection
-            if 'kolonaki' in url_lower:
-                return 'Κολωνάκι'
-            elif 'pangrati' in url_lower:
-                return 'Παγκράτι'
-            elif 'exarchia' in url_lower:
-                return 'Εξάρχεια'
-            elif 'plaka' in url_lower:
-                return 'Πλάκα'
-            elif 'psirri' in url_lower:
-                return 'Ψυρρή'
-            elif 'monastiraki' in url_lower:
-                return 'Μοναστηράκι'
-            elif 'koukaki' in url_lower:
-                return 'Κουκάκι'
-            elif 'petralona' in url_lower:
-                return 'Πετράλωνα'
-            elif 'kypseli' in url_lower:
-                return 'Κυψέλη'
-            elif 'ampelokipoi' in url_lower:
-                return 'Αμπελόκηποι'
+            match = URL_AREA_PATTERN.search(url_lower)
+            if match:
+                return URL_AREA_SLUGS[match.group(0)]
             
             # Try to extract from current page content
             try:
                 page_text = await page.inner_text('body')
-                return await self.extract_area_comprehensive(page_text, "", "Κέντρο Αθηνών")
+                return await self.run_sync(self.extract_area_comprehensive, ExtractionContext(page_text), "Κέντρο Αθηνών")
             except:
                 pass
             
@@ -785,69 +899,27 @@ class AthensComprehensive150Scraper:
             return "Κέντρο Αθηνών"
     
     async def generate_final_comprehensive_csv(self):
-        """Generate final comprehensive CSV with all 150+ properties"""
+        """Close the streamed CSV and write the summary from the running statistics"""
         try:
-            import os
-            os.makedirs('outputs', exist_ok=True)
+            self.close_csv_stream()
             
             # Analysis
             total_properties = len(self.all_properties)
-            with_sqm = [p for p in self.all_properties if p.get('sqm')]
-            with_energy = [p for p in self.all_properties if p.get('energy_class')]
-            with_area = [p for p in self.all_properties if p.get('area')]
-            
-            # Generate the main CSV file as requested
-            csv_file = '/Users/chrism/spitogatos_premium_analysis/outputs/athens_city_blocks_comprehensive_analysis.csv'
-            
-            if self.all_properties:
-                fieldnames = [
-                    'property_id', 'url', 'area', 'sqm', 'energy_class', 
-                    'title', 'property_type', 'listing_type', 'price', 
-                    'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
-                ]
-                
-                with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                    writer = csv.DictWriter(f, fieldnames=fieldnames)
-                    writer.writeheader()
-                    
-                    for prop in self.all_properties:
-                        writer.writerow({
-                            'property_id': prop.get('property_id', ''),
-                            'url': prop.get('url', ''),
-                            'area': prop.get('area', ''),
-                            'sqm': prop.get('sqm', ''),
-                            'energy_class': prop.get('energy_class', ''),
-                            'title': prop.get('title', ''),
-                            'property_type': prop.get('property_type', ''),
-                            'listing_type': prop.get('listing_type', ''),
-                            'price': prop.get('price', ''),
-                            'price_per_sqm': prop.get('price_per_sqm', ''),
-                            'rooms': prop.get('rooms', ''),
-                            'floor': prop.get('floor', ''),
-                            'extraction_timestamp': prop.get('extraction_timestamp', '')
-                        })
+            csv_file = self.csv_file
             
             # Generate summary report
-            json_file = f'outputs/athens_comprehensive_summary_{self.session_id}.json'
+            json_file = self.output_dir / f'athens_comprehensive_summary_{self.session_id}.json'
             
             # Statistics
-            area_distribution = {}
-            for prop in self.all_properties:
-                area = prop.get('area', 'Unknown')
-                area_distribution[area] = area_distribution.get(area, 0) + 1
+            area_distribution = self.area_distribution
+            energy_distribution = self.energy_distribution
             
-            energy_distribution = {}
-            for prop in with_energy:
-                energy = prop['energy_class']
-                energy_distribution[energy] = energy_distribution.get(energy, 0) + 1
-            
-            sqm_values = [p['sqm'] for p in with_sqm]
             sqm_stats = {}
-            if sqm_values:
+            if self.sqm_count:
                 sqm_stats = {
-                    'min_sqm': min(sqm_values),
-                    'max_sqm': max(sqm_values),
-                    'avg_sqm': sum(sqm_values) / len(sqm_values)
+                    'min_sqm': self.sqm_min,
+                    'max_sqm': self.sqm_max,
+                    'avg_sqm': self.sqm_sum / self.sqm_count
                 }
             
             summary = {
@@ -860,19 +932,24 @@ class AthensComprehensive150Scraper:
                 },
                 'data_completeness': {
                     'total_properties': total_properties,
-                    'properties_with_sqm': len(with_sqm),
-                    'properties_with_energy_class': len(with_energy),
-                    'properties_with_area': len(with_area),
-                    'sqm_completion_rate': f"{len(with_sqm)}/{total_properties} ({100*len(with_sqm)/max(1,total_properties):.1f}%)",
-                    'energy_completion_rate': f"{len(with_energy)}/{total_properties} ({100*len(with_energy)/max(1,total_properties):.1f}%)"
+                    'properties_with_sqm': self.sqm_count,
+                    'properties_with_energy_class': self.energy_count,
+                    'properties_with_area': self.area_count,
+                    'sqm_completion_rate': f"{self.sqm_count}/{total_properties} ({100*self.sqm_count/max(1,total_properties):.1f}%)",
+                    'energy_completion_rate': f"{self.energy_count}/{total_properties} ({100*self.energy_count/max(1,total_properties):.1f}%)"
                 },
                 'area_distribution': area_distribution,
                 'energy_class_distribution': energy_distribution,
                 'sqm_statistics': sqm_stats
             }
             
-            with open(json_file, 'w', encoding='utf-8') as f:
-                json.dump(summary, f, indent=2, ensure_ascii=False)
+            if orjson:
+                json_file.write_bytes(
+                    orjson.dumps(summary, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(json_file, 'w', encoding='utf-8') as f:
+                    json.dump(summary, f, indent=2, ensure_ascii=False)
             
             # Final report
             logger.info("\n" + "="*100)
@@ -881,13 +958,13 @@ class AthensComprehensive150Scraper:
             logger.info(f"🎯 FINAL RESULT: {total_properties} properties extracted")
             logger.info(f"🎯 TARGET STATUS: {'✅ ACHIEVED' if total_properties >= self.total_target_properties else '📊 PARTIAL'}")
             logger.info(f"📊 Data Completeness:")
-            logger.info(f"   📐 SQM Data: {len(with_sqm)}/{total_properties} ({100*len(with_sqm)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🔋 Energy Class: {len(with_energy)}/{total_properties} ({100*len(with_energy)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🏘️ Area Data: {len(with_area)}/{total_properties} ({100*len(with_area)/max(1,total_properties):.1f}%)")
+            logger.info(f"   📐 SQM Data: {self.sqm_count}/{total_properties} ({100*self.sqm_count/max(1,total_properties):.1f}%)")
+            logger.info(f"   🔋 Energy Class: {self.energy_count}/{total_properties} ({100*self.energy_count/max(1,total_properties):.1f}%)")
+            logger.info(f"   🏘️ Area Data: {self.area_count}/{total_properties} ({100*self.area_count/max(1,total_properties):.1f}%)")
             
             if area_distribution:
                 logger.info(f"\n🏘️ CITY BLOCKS DISTRIBUTION:")
-                for area, count in sorted(area_distribution.items(), key=lambda x: x[1], reverse=True):
+                for area, count in area_distribution.most_common():
                     logger.info(f"   {area}: {count} properties")
             
             if energy_distribution:
@@ -5,31 +5,201 @@ Direct property ID enumeration approach to reach 150+ properties
 """
 
 import asyncio
+import bisect
 import json
 import logging
 import re
 import csv
+import os
+from collections import Counter
 from datetime import datetime
-from typing import List, Dict, Optional
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
+import aiohttp
+from bs4 import BeautifulSoup
 from playwright.async_api import async_playwright
 import random
 import hashlib
+import zlib
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+CSV_FIELDNAMES = [
+    'property_id', 'url', 'area', 'sqm', 'energy_class', 
+    'title', 'property_type', 'listing_type', 'price', 
+    'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
+]
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+
+PROPERTY_ID_PATTERN = re.compile(r'/property/(\d+)')
+
+# Request pacing shared by all workers, and the backoff applied while the site throttles
+MAX_REQUESTS_PER_SECOND = 10
+THROTTLED_STATUSES = (429, 503)
+MAX_BACKOFF_SECONDS = 60
+
+PROBE_ORDER_SEED = 42  # Fixed so reruns probe candidate IDs in the same order
+
+# Smallest Content-Length a listing page is sent with; the header counts compressed
+# bytes, so this stays well below the size of a gzipped listing
+MIN_PROPERTY_PAGE_BYTES = 8000
+
+# Requests the browser never needs to extract a listing
+BLOCKED_RESOURCE_TYPES = frozenset(['image', 'media', 'font', 'stylesheet', 'other'])
+
+# Field extraction patterns, tried in order
+SQM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+(?:\.\d+)?)\s*m²',
+    r'(\d+(?:\.\d+)?)\s*sq\.?\s*m\.?',
+    r'(\d+(?:\.\d+)?)\s*τ\.μ\.?',
+    r'(\d+(?:\.\d+)?)\s*m2',
+    r'(\d+(?:\.\d+)?)\s*square\s*meters?',
+    r'(\d+(?:\.\d+)?)\s*τετραγωνικά',
+    r'Size[:\s]*(\d+(?:\.\d+)?)',
+    r'Area[:\s]*(\d+(?:\.\d+)?)',
+    r'Εμβαδόν[:\s]*(\d+(?:\.\d+)?)',
+    r'Μέγεθος[:\s]*(\d+(?:\.\d+)?)',
+    r'apartment.*?(\d+(?:\.\d+)?)\s*m²',
+    r'(\d+(?:\.\d+)?)\s*m²\s*apartment',
+    r'(\d+(?:\.\d+)?)\s*sqm'
+))
+
+ENERGY_CLASSES = frozenset(['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G'])
+ENERGY_LETTER_PATTERN = re.compile(r'([A-G][+]?)', re.IGNORECASE)
+ENERGY_TEXT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'ενεργειακή\s+κλάση[:\s]*([A-G][+]?)',
+    r'energy\s+class[:\s]*([A-G][+]?)',
+    r'energy\s+rating[:\s]*([A-G][+]?)',
+    r'ενεργειακό\s+πιστοποιητικό[:\s]*([A-G][+]?)',
+    r'energy\s+certificate[:\s]*([A-G][+]?)',
+    r'([A-G][+]?)\s*class',
+    r'class\s*([A-G][+]?)'
+))
+
+PRICE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'€\s*([\d,\.]+)',
+    r'([\d,\.]+)\s*€',
+    r'EUR\s*([\d,\.]+)',
+    r'Price[:\s]*€?\s*([\d,\.]+)',
+    r'Τιμή[:\s]*€?\s*([\d,\.]+)'
+))
+
+ROOM_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*δωμάτια',
+    r'(\d+)\s*δωμάτιο',
+    r'(\d+)\s*rooms?',
+    r'(\d+)\s*bedroom',
+    r'(\d+)\s*υπνοδωμάτια'
+))
+
+FLOOR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d+)\s*όροφος',
+    r'(\d+)\s*floor',
+    r'όροφος[:\s]*(\d+)',
+    r'floor[:\s]*(\d+)'
+))
+
+# Athens neighborhoods by price per sqm: prices above AREA_PRICE_THRESHOLDS[i]
+# fall in AREAS_BY_PRICE_PER_SQM[i + 1]
+AREA_PRICE_THRESHOLDS = (700, 900, 1100, 1300, 1600, 2000, 2500, 3000, 4000)
+AREAS_BY_PRICE_PER_SQM = (
+    'Πετράλωνα',    # Petralona
+    'Αμπελόκηποι',  # Ampelokipoi
+    'Κυψέλη',       # Kypseli
+    'Μοναστηράκι',  # Monastiraki
+    'Ψυρρή',        # Psirri
+    'Εξάρχεια',     # Exarchia
+    'Κουκάκι',      # Koukaki
+    'Παγκράτι',     # Pangrati
+    'Πλάκα',        # Plaka - historic center
+    'Κολωνάκι'      # Kolonaki - premium area
+)
+
+# Property type keywords, lowercase, in priority order; anything else is an apartment
+PROPERTY_TYPE_KEYWORDS = (
+    ('house', ('μονοκατοικία', 'house', 'villa', 'βίλα')),
+    ('maisonette', ('μεζονέτα', 'maisonette', 'duplex')),
+    ('studio', ('στούντιο', 'studio')),
+    ('penthouse', ('οροφοδιαμέρισμα', 'penthouse', 'ρετιρέ')),
+    ('loft', ('loft', 'λοφτ'))
+)
+
+# Indicators of a property page, and of an error page; all lowercase
+PROPERTY_PAGE_INDICATORS = (
+    'm²', 'τ.μ', 'sqm', 'square', 'τετραγωνικά',
+    '€', 'eur', 'price', 'τιμή',
+    'bedroom', 'δωμάτιο', 'rooms',
+    'apartment', 'διαμέρισμα', 'μεζονέτα',
+    'energy', 'ενεργειακή'
+)
+PAGE_ERROR_INDICATORS = (
+    'not found', '404', 'error', 'σφάλμα',
+    'page not found', 'δεν βρέθηκε'
+)
+
+def compile_page_check_database():
+    """Hyperscan database of all page indicators; IDs past the property indicators are errors"""
+    literals = PROPERTY_PAGE_INDICATORS + PAGE_ERROR_INDICATORS
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(literal).encode() for literal in literals],
+        ids=list(range(len(literals))),
+        elements=len(literals),
+        flags=[hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP
+               | hyperscan.HS_FLAG_SINGLEMATCH] * len(literals)
+    )
+    return database
+
+PAGE_CHECK_DATABASE = compile_page_check_database() if hyperscan else None
+
+# Literal each variant above cannot match without, lowercased and in tuple order.
+# scan_text_fields checks these against one lowercased copy of the text so only
+# variants that can match are run as regex scans
+TEXT_FIELD_VARIANTS = {
+    'sqm': tuple(zip(('m²', 'sq', 'τ.μ', 'm2', 'square', 'τετραγωνικά', 'size', 'area',
+                      'εμβαδόν', 'μέγεθος', 'apartment', 'apartment', 'sqm'), SQM_PATTERNS)),
+    'price': tuple(zip(('€', '€', 'eur', 'price', 'τιμή'), PRICE_PATTERNS)),
+    'rooms': tuple(zip(('δωμάτια', 'δωμάτιο', 'room', 'bedroom', 'υπνοδωμάτια'), ROOM_PATTERNS)),
+    'floor': tuple(zip(('όροφος', 'floor', 'όροφος', 'floor'), FLOOR_PATTERNS))
+}
+
+# Valid range per field; SQM takes any valid match, the others only a variant's first match
+TEXT_FIELD_RANGES = {'sqm': (8, 3000), 'price': (5000, 50000000), 'rooms': (0, 12), 'floor': (0, 20)}
+
 class AthensDirectPropertyScraper:
     def __init__(self):
-        self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
-        self.all_properties = []
+        started = datetime.now()
+        self.session_id = started.strftime("%Y%m%d_%H%M%S")
+        self.batch_timestamp = started.isoformat()  # Shared extraction timestamp for this run
+        self.columns = {field: [] for field in CSV_FIELDNAMES}  # One list per CSV column
         self.existing_urls = set()
         self.found_property_ids = set()
+        self.dead_ids = set()  # Property IDs that answered as missing; never probed again
         
         # Base URLs for property discovery
         self.base_property_url = "https://www.spitogatos.gr/en/property/"
         self.base_greek_url = "https://www.spitogatos.gr/property/"
         
         self.target_properties = 150
+        self.probe_concurrency = 16  # Browser tabs probing property IDs in parallel
+        self.http = None  # aiohttp session for the plain-GET fast path
+        self.next_request_at = 0.0  # Event loop time of the next free request slot
+        self.backoff_seconds = 0
+        
+        # Main CSV, written row by row as properties are found
+        self.csv_file = '/Users/chrism/spitogatos_premium_analysis/outputs/athens_city_blocks_comprehensive_analysis.csv'
+        self.csv_handle = None
+        self.csv_writer = None
+        
+        # Dead IDs carried between runs so restarts skip them
+        self.dead_ids_file = '/Users/chrism/spitogatos_premium_analysis/outputs/dead_ids.json'
     
     async def load_existing_verified_properties(self):
         """Load existing 9 verified properties as foundation"""
@@ -57,24 +227,44 @@ class AthensDirectPropertyScraper:
                     'price_per_sqm': prop.get('price_per_sqm'),
                     'rooms': prop.get('rooms'),
                     'floor': prop.get('floor'),
-                    'extraction_timestamp': prop.get('source_timestamp', datetime.now().isoformat()),
+                    'extraction_timestamp': prop.get('source_timestamp', self.batch_timestamp),
                     'data_source': 'existing_verified'
                 }
                 
-                self.all_properties.append(enhanced_prop)
+                self.add_property(enhanced_prop)
                 self.existing_urls.add(prop['url'])
             
-            logger.info(f"✅ Foundation: {len(self.all_properties)} verified properties loaded")
+            logger.info(f"✅ Foundation: {self.property_count()} verified properties loaded")
             logger.info(f"📊 Property ID range: {min(self.found_property_ids)} - {max(self.found_property_ids)}")
-            return len(self.all_properties)
+            return self.property_count()
             
         except Exception as e:
             logger.error(f"❌ Failed to load existing properties: {e}")
             return 0
     
+    def load_dead_ids(self):
+        """Load property IDs found dead by earlier runs"""
+        try:
+            with open(self.dead_ids_file, 'r') as f:
+                self.dead_ids.update(json.load(f))
+            logger.info(f"📁 Loaded {len(self.dead_ids)} dead property IDs from earlier runs")
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.error(f"❌ Failed to load dead property IDs: {e}")
+    
+    def save_dead_ids(self):
+        """Persist dead property IDs for the next run"""
+        try:
+            os.makedirs(os.path.dirname(self.dead_ids_file), exist_ok=True)
+            with open(self.dead_ids_file, 'w') as f:
+                json.dump(sorted(property_id for property_id in self.dead_ids if property_id is not None), f)
+        except Exception as e:
+            logger.error(f"❌ Failed to save dead property IDs: {e}")
+    
     def extract_property_id_from_url(self, url: str) -> Optional[int]:
         """Extract numeric property ID from URL"""
-        match = re.search(r'/property/(\d+)', url)
+        match = PROPERTY_ID_PATTERN.search(url)
         if match:
             return int(match.group(1))
         return None
@@ -83,60 +273,39 @@ class AthensDirectPropertyScraper:
         """Smart area assignment based on price and location hints"""
         price_per_sqm = prop.get('price_per_sqm', 0)
         
-        # Price-based area assignment for Athens neighborhoods
-        if price_per_sqm > 4000:
-            return 'Κολωνάκι'  # Kolonaki - premium area
-        elif price_per_sqm > 3000:
-            return 'Πλάκα'     # Plaka - historic center
-        elif price_per_sqm > 2500:
-            return 'Παγκράτι'  # Pangrati
-        elif price_per_sqm > 2000:
-            return 'Κουκάκι'   # Koukaki
-        elif price_per_sqm > 1600:
-            return 'Εξάρχεια'  # Exarchia
-        elif price_per_sqm > 1300:
-            return 'Ψυρρή'     # Psirri
-        elif price_per_sqm > 1100:
-            return 'Μοναστηράκι' # Monastiraki
-        elif price_per_sqm > 900:
-            return 'Κυψέλη'    # Kypseli
-        elif price_per_sqm > 700:
-            return 'Αμπελόκηποι' # Ampelokipoi
-        else:
-            return 'Πετράλωνα' # Petralona
+        return self.assign_area_by_price_per_sqm(price_per_sqm or 0)
     
     def generate_property_id(self, url: str) -> str:
         """Generate consistent property ID from URL"""
-        match = re.search(r'/property/(\d+)', url)
+        match = PROPERTY_ID_PATTERN.search(url)
         if match:
             return f"SPT_{match.group(1)}"
         else:
-            url_hash = hashlib.md5(url.encode()).hexdigest()[:8]
+            url_hash = hashlib.blake2b(url.encode(), digest_size=4).hexdigest()
             return f"SPT_{url_hash}"
     
     def generate_property_id_ranges(self) -> List[int]:
-        """Generate property ID ranges based on known IDs"""
+        """Generate unique candidate property IDs around known IDs, in a shuffled probe order"""
         if not self.found_property_ids:
             # Default range if no existing IDs
-            return list(range(1114000000, 1119000000, 10000))
-        
-        min_id = min(self.found_property_ids)
-        max_id = max(self.found_property_ids)
-        
-        # Generate ranges around known IDs
-        ranges = []
-        
-        # Around minimum ID
-        ranges.extend(range(min_id - 100000, min_id, 1000))
-        
-        # Between known IDs
-        ranges.extend(range(min_id, max_id + 100000, 1000))
+            candidates = set(range(1114000000, 1119000000, 10000))
+        else:
+            min_id = min(self.found_property_ids)
+            max_id = max(self.found_property_ids)
+            
+            # Around minimum ID, between known IDs and around maximum ID; the ranges overlap
+            candidates = set(chain(
+                range(min_id - 100000, min_id, 1000),
+                range(min_id, max_id + 100000, 1000),
+                range(max_id, max_id + 200000, 1000)
+            ))
         
-        # Around maximum ID
-        ranges.extend(range(max_id, max_id + 200000, 1000))
+        # Filter out existing and known-dead IDs
+        candidates = sorted(candidates - self.found_property_ids - self.dead_ids)
         
-        # Filter out existing IDs
-        return [id for id in ranges if id not in self.found_property_ids]
+        # Spread the capped number of attempts over the whole span instead of its low end
+        random.Random(PROBE_ORDER_SEED).shuffle(candidates)
+        return candidates
     
     async def run_direct_property_discovery(self):
         """Direct property discovery by ID enumeration"""
@@ -145,149 +314,329 @@ class AthensDirectPropertyScraper:
         
         # Load existing properties
         await self.load_existing_verified_properties()
+        self.load_dead_ids()
         
         async with async_playwright() as p:
             browser = await p.chromium.launch(headless=True)
             context = await browser.new_context(
                 viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
+                user_agent=USER_AGENT
+            )
+            await context.route("**/*", self.block_heavy_resources)
+            self.http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10),
+                headers={'User-Agent': USER_AGENT}
             )
             
             try:
-                page = await context.new_page()
+                self.open_csv_stream()
                 
                 logger.info("🔍 Starting direct property ID discovery...")
-                await self.discover_properties_by_id(page)
+                await self.discover_properties_by_id(context)
                 
-                logger.info("📊 Generating final comprehensive CSV")
+                self.close_csv_stream()
+                logger.info("📊 Generating final comprehensive report")
                 await self.generate_final_csv()
                 
             except Exception as e:
                 logger.error(f"❌ Direct discovery failed: {e}")
             finally:
+                self.close_csv_stream()
+                self.save_dead_ids()
+                await self.http.close()
                 await browser.close()
     
-    async def discover_properties_by_id(self, page):
-        """Discover properties by trying sequential property IDs"""
+    async def block_heavy_resources(self, route):
+        """Abort asset requests so rendered pages only load documents and scripts"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    def open_csv_stream(self):
+        """Open the main CSV and write the properties collected so far"""
+        try:
+            os.makedirs(os.path.dirname(self.csv_file), exist_ok=True)
+            self.csv_handle = open(self.csv_file, 'w', newline='', encoding='utf-8', buffering=1 << 20)
+            self.csv_writer = csv.writer(self.csv_handle)
+            self.csv_writer.writerow(CSV_FIELDNAMES)
+            self.csv_writer.writerows(zip(*self.columns.values()))
+        except Exception as e:
+            logger.error(f"❌ Could not open CSV {self.csv_file}, continuing without it: {e}")
+            self.close_csv_stream()
+    
+    def close_csv_stream(self):
+        """Flush and close the main CSV"""
+        if self.csv_handle:
+            self.csv_handle.close()
+        self.csv_handle = None
+        self.csv_writer = None
+    
+    async def discover_properties_by_id(self, context):
+        """Discover properties by probing candidate property IDs from a pool of tabs"""
         
         property_ranges = self.generate_property_id_ranges()
         logger.info(f"🔍 Generated {len(property_ranges)} property ID candidates")
         
-        successful_finds = 0
-        attempts = 0
         max_attempts = min(500, len(property_ranges))  # Limit attempts
-        
+        id_queue = asyncio.Queue()
         for property_id in property_ranges[:max_attempts]:
-            if len(self.all_properties) >= self.target_properties:
-                logger.info(f"🎯 Target reached: {len(self.all_properties)} properties")
+            id_queue.put_nowait(property_id)
+        
+        progress = {'attempts': 0, 'successful_finds': 0}
+        
+        async def worker():
+            # Each worker keeps one tab open for all of its probes
+            page = await context.new_page()
+            try:
+                while not id_queue.empty() and self.property_count() < self.target_properties:
+                    property_id = id_queue.get_nowait()
+                    progress['attempts'] += 1
+                    attempt = progress['attempts']
+                    
+                    if await self.probe_property_id(page, property_id, attempt, max_attempts):
+                        progress['successful_finds'] += 1
+                    
+                    # Progress update every 50 attempts
+                    if attempt % 50 == 0:
+                        logger.info(f"📊 Progress: {attempt}/{max_attempts} attempts, {progress['successful_finds']} new properties found")
+            finally:
+                await page.close()
+        
+        await asyncio.gather(*(worker() for _ in range(min(self.probe_concurrency, max_attempts))))
+        
+        if self.property_count() >= self.target_properties:
+            logger.info(f"🎯 Target reached: {self.property_count()} properties")
+    
+    async def probe_property_id(self, page, property_id: int, attempt: int, max_attempts: int) -> bool:
+        """Try the English and Greek URLs for one property ID; True if a new property was added"""
+        # Try both English and Greek URLs
+        urls_to_try = [
+            f"{self.base_property_url}{property_id}",
+            f"{self.base_greek_url}{property_id}"
+        ]
+        
+        for url in urls_to_try:
+            if url in self.existing_urls:
+                continue
+            if property_id in self.dead_ids:
                 break
             
-            attempts += 1
-            
-            # Try both English and Greek URLs
-            urls_to_try = [
-                f"{self.base_property_url}{property_id}",
-                f"{self.base_greek_url}{property_id}"
-            ]
-            
-            for url in urls_to_try:
-                if url in self.existing_urls:
-                    continue
+            try:
+                logger.info(f"🔍 [{attempt}/{max_attempts}] Trying: {url}")
                 
-                try:
-                    logger.info(f"🔍 [{attempts}/{max_attempts}] Trying: {url}")
-                    
-                    response = await page.goto(url, wait_until="domcontentloaded", timeout=15000)
-                    
-                    if response and response.status == 200:
-                        # Check if it's a valid property page (not 404 or error)
-                        page_content = await page.content()
+                # Fast path: plain GET and regex extraction, no browser rendering
+                status, html = await self.fetch_html(url)
+                
+                if status == 200:
+                    property_data = None
+                    if self.is_valid_property_page(html):
+                        property_data = await self.extract_property_data_from_html(url, html)
                         
-                        if self.is_valid_property_page(page_content):
-                            property_data = await self.extract_property_data_comprehensive(page, url)
-                            
-                            if property_data and property_data['url'] not in self.existing_urls:
-                                self.all_properties.append(property_data)
-                                self.existing_urls.add(property_data['url'])
-                                successful_finds += 1
-                                
-                                logger.info(f"✅ Found [{len(self.all_properties)}/{self.target_properties}]: "
-                                          f"{property_data.get('area', 'N/A')} | "
-                                          f"{property_data.get('sqm', 'N/A')}m² | "
-                                          f"Energy: {property_data.get('energy_class', 'N/A')}")
-                                
-                                break  # Move to next property_id
-                    
-                    # Small delay between requests
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.debug(f"❌ Failed to access {url}: {e}")
-                    continue
-            
-            # Progress update every 50 attempts
-            if attempts % 50 == 0:
-                logger.info(f"📊 Progress: {attempts}/{max_attempts} attempts, {successful_finds} new properties found")
+                        # Energy class may only appear once scripts have rendered the page
+                        if not property_data or not property_data.get('energy_class'):
+                            # A browser timeout must not throw away what the plain GET found
+                            try:
+                                property_data = await self.render_property_page(page, url) or property_data
+                            except Exception as e:
+                                logger.debug(f"❌ Rendering failed for {url}, keeping the plain GET result: {e}")
+                elif status in (404, 410):
+                    self.dead_ids.add(property_id)
+                    property_data = None
+                elif status and 300 <= status < 400:
+                    # Redirects never land on the requested listing
+                    property_data = None
+                else:
+                    # Blocked or failed plain request, retry through the browser
+                    property_data = await self.render_property_page(page, url)
+                
+                if self.record_property(property_data):
+                    return True  # Move to next property_id
+                
+            except Exception as e:
+                logger.debug(f"❌ Failed to access {url}: {e}")
+                continue
+        
+        return False
+    
+    async def wait_for_request_slot(self):
+        """Sleep only as long as needed to keep all workers under MAX_REQUESTS_PER_SECOND"""
+        now = asyncio.get_running_loop().time()
+        slot = max(now, self.next_request_at)
+        self.next_request_at = slot + 1 / MAX_REQUESTS_PER_SECOND
+        if slot > now:
+            await asyncio.sleep(slot - now)
+    
+    def note_response_status(self, status: Optional[int]):
+        """Back off exponentially while the site answers 429/503, and reset once it recovers"""
+        if status in THROTTLED_STATUSES:
+            self.backoff_seconds = min(MAX_BACKOFF_SECONDS, self.backoff_seconds * 2 or 1)
+            logger.warning(f"⚠️ Throttled with status {status}, pausing requests for {self.backoff_seconds}s")
+            # Pushing the next slot back pauses every worker, not just this one
+            resume_at = asyncio.get_running_loop().time() + self.backoff_seconds
+            self.next_request_at = max(self.next_request_at, resume_at)
+        elif status == 200:
+            self.backoff_seconds = 0
+    
+    async def fetch_html(self, url: str) -> Tuple[Optional[int], Optional[str]]:
+        """GET a page without the browser; returns (status, html), or (None, None) on network errors"""
+        await self.wait_for_request_slot()
+        try:
+            # Redirects are not followed, so a bounce can't pass for the requested listing
+            async with self.http.get(url, allow_redirects=False) as response:
+                self.note_response_status(response.status)
+                if response.status != 200:
+                    # Dead IDs bounce to search results
+                    if '/search' in response.headers.get('Location', ''):
+                        self.dead_ids.add(self.extract_property_id_from_url(url))
+                    return response.status, None
+                return response.status, await response.text()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.debug(f"❌ Plain GET failed for {url}: {e}")
+            return None, None
+    
+    async def render_property_page(self, page, url: str) -> Optional[Dict]:
+        """Load a property page in the browser and extract it, or None if it is not a listing"""
+        # Return as soon as the response arrives so dead IDs never wait on the DOM
+        await self.wait_for_request_slot()
+        response = await page.goto(url, wait_until="commit", timeout=8000)
+        if response:
+            self.note_response_status(response.status)
+        
+        # Redirects, errors and bounces to search results are not listings
+        if not response or response.status != 200 or '/search' in page.url:
+            # Blocks and server errors may clear up; only missing listings are dead
+            if '/search' in page.url or (response and response.status in (404, 410)):
+                self.dead_ids.add(self.extract_property_id_from_url(url))
+            return None
+        
+        # Judge the response headers before pulling the DOM over to Python
+        if response.url != url or 'text/html' not in response.headers.get('content-type', 'text/html'):
+            return None
+        content_length = int(response.headers.get('content-length') or 0)
+        if content_length and content_length < MIN_PROPERTY_PAGE_BYTES:
+            return None
+        
+        await page.wait_for_load_state('domcontentloaded', timeout=5000)
+        
+        # One DOM snapshot serves both the validity check and the extraction
+        page_content = await page.content()
+        
+        if self.is_valid_property_page(page_content):
+            return await self.extract_property_data_from_html(url, page_content)
+        
+        return None
+    
+    def add_property(self, property_data: Dict) -> tuple:
+        """Append a property to the columns; returns its CSV row"""
+        row = tuple(property_data.get(field) for field in CSV_FIELDNAMES)
+        for column, value in zip(self.columns.values(), row):
+            column.append(value)
+        return row
+    
+    def property_count(self) -> int:
+        """Number of properties collected so far"""
+        return len(self.columns['url'])
+    
+    def record_property(self, property_data: Optional[Dict]) -> bool:
+        """Add a newly discovered property unless it is a duplicate or the target is met"""
+        # No await between the check and the append, so workers cannot race here
+        if (property_data and property_data['url'] not in self.existing_urls
+                and self.property_count() < self.target_properties):
+            row = self.add_property(property_data)
+            self.existing_urls.add(property_data['url'])
+            if self.csv_writer:
+                self.csv_writer.writerow(row)
+            
+            logger.info(f"✅ Found [{self.property_count()}/{self.target_properties}]: "
+                      f"{property_data.get('area', 'N/A')} | "
+                      f"{property_data.get('sqm', 'N/A')}m² | "
+                      f"Energy: {property_data.get('energy_class', 'N/A')}")
+            return True
+        
+        return False
     
     def is_valid_property_page(self, page_content: str) -> bool:
         """Check if the page content indicates a valid property listing"""
-        # Look for indicators of a property page
-        indicators = [
-            'm²', 'τ.μ', 'sqm', 'square', 'τετραγωνικά',
-            '€', 'EUR', 'price', 'τιμή',
-            'bedroom', 'δωμάτιο', 'rooms',
-            'apartment', 'διαμέρισμα', 'μεζονέτα',
-            'energy', 'ενεργειακή'
-        ]
+        if PAGE_CHECK_DATABASE is not None:
+            # One caseless pass over the raw bytes finds every indicator at once
+            found = set()
+            
+            def on_match(literal_id, start, end, flags, context):
+                found.add(literal_id)
+            
+            PAGE_CHECK_DATABASE.scan(page_content.encode(), match_event_handler=on_match)
+            
+            # Without error hits every ID found is a property indicator
+            has_errors = any(literal_id >= len(PROPERTY_PAGE_INDICATORS) for literal_id in found)
+            return len(found) >= 3 and not has_errors
         
         page_lower = page_content.lower()
         
-        # Must have at least 3 indicators
-        indicator_count = sum(1 for indicator in indicators if indicator in page_lower)
-        
-        # Check for error indicators
-        error_indicators = [
-            'not found', '404', 'error', 'σφάλμα',
-            'page not found', 'δεν βρέθηκε'
-        ]
+        # Error pages are rejected before any indicator is counted
+        if any(error in page_lower for error in PAGE_ERROR_INDICATORS):
+            return False
+
+        # Must have at least 3 indicators; stop scanning at the third
+        indicator_count = 0
+        for indicator in PROPERTY_PAGE_INDICATORS:
+            if indicator in page_lower:
+                indicator_count += 1
+                if indicator_count >= 3:
+                    return True
+
+        return False
+    
+    async def extract_property_data_from_html(self, property_url: str, html: str) -> Optional[Dict]:
+        """Extract property data from raw or rendered page HTML"""
+        soup, page_text, title = self.parse_page_html(html)
+        return await self.build_property_data(property_url, page_text, html, title, soup)
+    
+    def parse_page_html(self, html: str):
+        """Parse page HTML once into (soup, visible body text, title)"""
+        soup = BeautifulSoup(html, 'lxml')
+        title = soup.title.get_text(strip=True) if soup.title else ""
         
-        has_errors = any(error in page_lower for error in error_indicators)
+        # Script and style contents are not part of the visible text
+        for tag in soup(['script', 'style', 'noscript']):
+            tag.decompose()
+        page_text = (soup.body or soup).get_text(' ')
         
-        return indicator_count >= 3 and not has_errors
+        return soup, page_text, title
     
-    async def extract_property_data_comprehensive(self, page, property_url: str) -> Optional[Dict]:
-        """Extract comprehensive property data"""
+    async def build_property_data(self, property_url: str, page_text: str, page_content: str,
+                                  title: str, soup: BeautifulSoup) -> Optional[Dict]:
+        """Run the field extractors over the parsed page"""
         try:
-            # Wait a moment for content to load
-            await asyncio.sleep(1)
-            
             property_data = {
                 'property_id': self.generate_property_id(property_url),
                 'url': property_url,
-                'extraction_timestamp': datetime.now().isoformat(),
+                'extraction_timestamp': self.batch_timestamp,
                 'data_source': 'direct_discovery'
             }
             
-            # Get page content
-            page_text = await page.inner_text('body')
-            page_content = await page.content()
-            title = await page.title()
-            
             property_data['title'] = title or ""
             
+            # One lowercased copy of the text serves every keyword check below
+            text_lower = page_text.lower()
+            
+            # SQM, price, rooms and floor number in one pass over the text
+            text_fields = self.scan_text_fields(page_text, text_lower)
+            
             # Extract SQM (REQUIRED)
-            sqm = await self.extract_sqm_ultimate(page_text)
+            sqm = text_fields.get('sqm')
             if not sqm:
                 return None  # Skip properties without SQM
             property_data['sqm'] = sqm
             
             # Extract energy class
-            energy_class = await self.extract_energy_class_comprehensive(page, page_text, page_content)
+            energy_class = await self.extract_energy_class_comprehensive(soup, page_text, page_content)
             if energy_class:
                 property_data['energy_class'] = energy_class
             
             # Extract price
-            price = await self.extract_price_advanced(page_text)
+            price = text_fields.get('price')
             if price:
                 property_data['price'] = price
                 if sqm and sqm > 0:
@@ -302,14 +651,16 @@ class AthensDirectPropertyScraper:
             property_data['area'] = area
             
             # Extract other details
-            property_data['property_type'] = await self.extract_property_type_advanced(page_text, title)
-            property_data['listing_type'] = await self.extract_listing_type(property_url, page_text)
+            property_data['property_type'] = await self.extract_property_type_advanced(text_lower, (title or "").lower())
+            property_data['listing_type'] = await self.extract_listing_type(property_url, text_lower)
             
-            rooms = await self.extract_rooms_advanced(page_text)
+            rooms = text_fields.get('rooms')
             if rooms:
                 property_data['rooms'] = rooms
             
-            floor = await self.extract_floor_advanced(page_text)
+            floor = self.extract_floor_keyword(text_lower)
+            if not floor and 'floor' in text_fields:
+                floor = f"Floor {text_fields['floor']}"
             if floor:
                 property_data['floor'] = floor
             
@@ -319,70 +670,55 @@ class AthensDirectPropertyScraper:
             logger.error(f"❌ Property extraction failed for {property_url}: {e}")
             return None
     
+    def scan_text_fields(self, page_text: str, text_lower: str) -> Dict:
+        """Extract SQM, price, rooms and floor number, scanning only variants whose keyword occurs"""
+        fields = {}
+        
+        for field_name, variants in TEXT_FIELD_VARIANTS.items():
+            low, high = TEXT_FIELD_RANGES[field_name]
+            for keyword, pattern in variants:
+                if keyword not in text_lower:
+                    continue
+                
+                matches = pattern.finditer(page_text) if field_name == 'sqm' else [pattern.search(page_text)]
+                value = None
+                for match in matches:
+                    if not match:
+                        continue
+                    try:
+                        if field_name == 'price':
+                            value = float(match.group(1).replace(',', '').replace('.', ''))
+                        elif field_name == 'sqm':
+                            value = float(match.group(1))
+                        else:
+                            value = int(match.group(1))
+                    except ValueError:
+                        continue
+                    if low <= value <= high:
+                        break
+                    value = None
+                
+                if value is not None:
+                    fields[field_name] = value
+                    break
+        
+        return fields
+    
     def assign_area_by_price_per_sqm(self, price_per_sqm: float) -> str:
         """Assign area based on price per square meter"""
-        if price_per_sqm > 4000:
-            return 'Κολωνάκι'
-        elif price_per_sqm > 3000:
-            return 'Πλάκα'
-        elif price_per_sqm > 2500:
-            return 'Παγκράτι'
-        elif price_per_sqm > 2000:
-            return 'Κουκάκι'
-        elif price_per_sqm > 1600:
-            return 'Εξάρχεια'
-        elif price_per_sqm > 1300:
-            return 'Ψυρρή'
-        elif price_per_sqm > 1100:
-            return 'Μοναστηράκι'
-        elif price_per_sqm > 900:
-            return 'Κυψέλη'
-        elif price_per_sqm > 700:
-            return 'Αμπελόκηποι'
-        else:
-            return 'Πετράλωνα'
+        # Each threshold is exclusive: a price exactly on it stays in the cheaper area
+        return AREAS_BY_PRICE_PER_SQM[bisect.bisect_left(AREA_PRICE_THRESHOLDS, price_per_sqm)]
     
     def assign_area_by_property_id(self, property_id: str) -> str:
         """Assign area based on property ID hash (for consistent distribution)"""
         areas = ['Κολωνάκι', 'Παγκράτι', 'Εξάρχεια', 'Πλάκα', 'Ψυρρή', 
                 'Μοναστηράκι', 'Κουκάκι', 'Πετράλωνα', 'Κυψέλη', 'Αμπελόκηποι']
         
-        # Use hash for consistent assignment
-        id_hash = hash(property_id)
+        # CRC32 is stable across runs, unlike the salted built-in str hash
+        id_hash = zlib.crc32(property_id.encode())
         return areas[id_hash % len(areas)]
     
-    async def extract_sqm_ultimate(self, page_text: str) -> Optional[float]:
-        """Ultimate SQM extraction"""
-        sqm_patterns = [
-            r'(\d+(?:\.\d+)?)\s*m²',
-            r'(\d+(?:\.\d+)?)\s*sq\.?\s*m\.?',
-            r'(\d+(?:\.\d+)?)\s*τ\.μ\.?',
-            r'(\d+(?:\.\d+)?)\s*m2',
-            r'(\d+(?:\.\d+)?)\s*square\s*meters?',
-            r'(\d+(?:\.\d+)?)\s*τετραγωνικά',
-            r'Size[:\s]*(\d+(?:\.\d+)?)',
-            r'Area[:\s]*(\d+(?:\.\d+)?)',
-            r'Εμβαδόν[:\s]*(\d+(?:\.\d+)?)',
-            r'Μέγεθος[:\s]*(\d+(?:\.\d+)?)',
-            r'apartment.*?(\d+(?:\.\d+)?)\s*m²',
-            r'(\d+(?:\.\d+)?)\s*m²\s*apartment',
-            r'(\d+(?:\.\d+)?)\s*sqm',
-            r'(\d+(?:\.\d+)?)\s*SQM'
-        ]
-        
-        for pattern in sqm_patterns:
-            matches = re.finditer(pattern, page_text, re.IGNORECASE)
-            for match in matches:
-                try:
-                    sqm = float(match.group(1))
-                    if 8 <= sqm <= 3000:
-                        return sqm
-                except (ValueError, IndexError):
-                    continue
-        
-        return None
-    
-    async def extract_energy_class_comprehensive(self, page, page_text: str, page_content: str) -> Optional[str]:
+    async def extract_energy_class_comprehensive(self, soup: BeautifulSoup, page_text: str, page_content: str) -> Optional[str]:
         """Comprehensive energy class extraction"""
         try:
             # CSS selectors
@@ -393,36 +729,21 @@ class AthensDirectPropertyScraper:
             ]
             
             for selector in energy_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        energy_text = await element.inner_text()
-                        energy_match = re.search(r'([A-G][+]?)', energy_text, re.IGNORECASE)
-                        if energy_match:
-                            energy_class = energy_match.group(1).upper()
-                            if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
-                                return energy_class
-                except:
-                    continue
+                for element in soup.select(selector):
+                    energy_match = ENERGY_LETTER_PATTERN.search(element.get_text(' '))
+                    if energy_match:
+                        energy_class = energy_match.group(1).upper()
+                        if energy_class in ENERGY_CLASSES:
+                            return energy_class
             
             # Text patterns
-            energy_patterns = [
-                r'ενεργειακή\s+κλάση[:\s]*([A-G][+]?)',
-                r'energy\s+class[:\s]*([A-G][+]?)',
-                r'energy\s+rating[:\s]*([A-G][+]?)',
-                r'ενεργειακό\s+πιστοποιητικό[:\s]*([A-G][+]?)',
-                r'energy\s+certificate[:\s]*([A-G][+]?)',
-                r'([A-G][+]?)\s*class',
-                r'class\s*([A-G][+]?)'
-            ]
-            
             combined_text = page_content + " " + page_text
             
-            for pattern in energy_patterns:
-                match = re.search(pattern, combined_text, re.IGNORECASE)
+            for pattern in ENERGY_TEXT_PATTERNS:
+                match = pattern.search(combined_text)
                 if match:
                     energy_class = match.group(1).upper()
-                    if energy_class in ['A+', 'A', 'B+', 'B', 'C+', 'C', 'D', 'E', 'F', 'G']:
+                    if energy_class in ENERGY_CLASSES:
                         return energy_class
             
             return None
@@ -430,152 +751,41 @@ class AthensDirectPropertyScraper:
         except Exception as e:
             return None
     
-    async def extract_price_advanced(self, page_text: str) -> Optional[float]:
-        """Advanced price extraction"""
-        price_patterns = [
-            r'€\s*([\d,\.]+)',
-            r'([\d,\.]+)\s*€',
-            r'EUR\s*([\d,\.]+)',
-            r'Price[:\s]*€?\s*([\d,\.]+)',
-            r'Τιμή[:\s]*€?\s*([\d,\.]+)'
-        ]
-        
-        for pattern in price_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                try:
-                    price_str = match.group(1).replace(',', '').replace('.', '')
-                    price = float(price_str)
-                    if 5000 <= price <= 50000000:
-                        return price
-                except (ValueError, IndexError):
-                    continue
+    async def extract_property_type_advanced(self, text_lower: str, title_lower: str) -> str:
+        """Advanced property type extraction from the lowercased page text and title"""
+        for property_type, keywords in PROPERTY_TYPE_KEYWORDS:
+            for keyword in keywords:
+                if keyword in text_lower or keyword in title_lower:
+                    return property_type
         
-        return None
-    
-    async def extract_property_type_advanced(self, page_text: str, title: str) -> str:
-        """Advanced property type extraction"""
-        full_text = (page_text + " " + title).lower()
-        
-        if any(word in full_text for word in ['μονοκατοικία', 'house', 'villa', 'βίλα']):
-            return 'house'
-        elif any(word in full_text for word in ['μεζονέτα', 'maisonette', 'duplex']):
-            return 'maisonette'
-        elif any(word in full_text for word in ['στούντιο', 'studio']):
-            return 'studio'
-        elif any(word in full_text for word in ['οροφοδιαμέρισμα', 'penthouse', 'ρετιρέ']):
-            return 'penthouse'
-        elif any(word in full_text for word in ['loft', 'λοφτ']):
-            return 'loft'
-        else:
-            return 'apartment'
+        return 'apartment'
     
-    async def extract_listing_type(self, url: str, page_text: str) -> str:
-        """Extract listing type"""
-        if 'rent' in url.lower() or any(word in page_text.lower() for word in ['ενοικίαση', 'ενοικιάζεται', 'for rent']):
+    async def extract_listing_type(self, url: str, text_lower: str) -> str:
+        """Extract listing type from the URL and the lowercased page text"""
+        if 'rent' in url.lower() or any(word in text_lower for word in ['ενοικίαση', 'ενοικιάζεται', 'for rent']):
             return 'rent'
         else:
             return 'sale'
     
-    async def extract_rooms_advanced(self, page_text: str) -> Optional[int]:
-        """Advanced rooms extraction"""
-        room_patterns = [
-            r'(\d+)\s*δωμάτια',
-            r'(\d+)\s*δωμάτιο',
-            r'(\d+)\s*rooms?',
-            r'(\d+)\s*bedroom',
-            r'(\d+)\s*υπνοδωμάτια'
-        ]
-        
-        for pattern in room_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                try:
-                    rooms = int(match.group(1))
-                    if 0 <= rooms <= 12:
-                        return rooms
-                except (ValueError, IndexError):
-                    continue
-        
-        return None
-    
-    async def extract_floor_advanced(self, page_text: str) -> Optional[str]:
-        """Advanced floor extraction"""
-        if any(word in page_text.lower() for word in ['ισόγειο', 'ground floor']):
+    def extract_floor_keyword(self, text_lower: str) -> Optional[str]:
+        """Ground floor and basement are named rather than numbered; expects lowercased text"""
+        if any(word in text_lower for word in ['ισόγειο', 'ground floor']):
             return 'Ground Floor'
-        elif any(word in page_text.lower() for word in ['υπόγειο', 'basement']):
+        elif any(word in text_lower for word in ['υπόγειο', 'basement']):
             return 'Basement'
-        
-        floor_patterns = [
-            r'(\d+)\s*όροφος',
-            r'(\d+)\s*floor',
-            r'όροφος[:\s]*(\d+)',
-            r'floor[:\s]*(\d+)'
-        ]
-        
-        for pattern in floor_patterns:
-            match = re.search(pattern, page_text, re.IGNORECASE)
-            if match:
-                try:
-                    floor_num = int(match.group(1))
-                    if 0 <= floor_num <= 20:
-                        return f"Floor {floor_num}"
-                except (ValueError, IndexError):
-                    continue
-        
         return None
     
     async def generate_final_csv(self):
-        """Generate final comprehensive CSV"""
+        """Report on the final comprehensive CSV, which is written while discovering"""
         try:
-            import os
-            os.makedirs('outputs', exist_ok=True)
-            
-            total_properties = len(self.all_properties)
-            with_sqm = [p for p in self.all_properties if p.get('sqm')]
-            with_energy = [p for p in self.all_properties if p.get('energy_class')]
-            with_area = [p for p in self.all_properties if p.get('area')]
-            
-            # Main CSV file
-            csv_file = '/Users/chrism/spitogatos_premium_analysis/outputs/athens_city_blocks_comprehensive_analysis.csv'
-            
-            fieldnames = [
-                'property_id', 'url', 'area', 'sqm', 'energy_class', 
-                'title', 'property_type', 'listing_type', 'price', 
-                'price_per_sqm', 'rooms', 'floor', 'extraction_timestamp'
-            ]
-            
-            with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for prop in self.all_properties:
-                    writer.writerow({
-                        'property_id': prop.get('property_id', ''),
-                        'url': prop.get('url', ''),
-                        'area': prop.get('area', ''),
-                        'sqm': prop.get('sqm', ''),
-                        'energy_class': prop.get('energy_class', ''),
-                        'title': prop.get('title', ''),
-                        'property_type': prop.get('property_type', ''),
-                        'listing_type': prop.get('listing_type', ''),
-                        'price': prop.get('price', ''),
-                        'price_per_sqm': prop.get('price_per_sqm', ''),
-                        'rooms': prop.get('rooms', ''),
-                        'floor': prop.get('floor', ''),
-                        'extraction_timestamp': prop.get('extraction_timestamp', '')
-                    })
+            total_properties = self.property_count()
+            with_sqm = sum(1 for sqm in self.columns['sqm'] if sqm)
+            with_energy = sum(1 for energy_class in self.columns['energy_class'] if energy_class)
+            with_area = sum(1 for area in self.columns['area'] if area)
             
             # Statistics
-            area_distribution = {}
-            for prop in self.all_properties:
-                area = prop.get('area', 'Unknown')
-                area_distribution[area] = area_distribution.get(area, 0) + 1
-            
-            energy_distribution = {}
-            for prop in with_energy:
-                energy = prop['energy_class']
-                energy_distribution[energy] = energy_distribution.get(energy, 0) + 1
+            area_distribution = Counter(self.columns['area'])
+            energy_distribution = Counter(energy_class for energy_class in self.columns['energy_class'] if energy_class)
             
             # Final report
             logger.info("\n" + "="*100)
@@ -584,13 +794,13 @@ class AthensDirectPropertyScraper:
             logger.info(f"🎯 FINAL RESULT: {total_properties} properties extracted")
             logger.info(f"🎯 TARGET STATUS: {'✅ ACHIEVED' if total_properties >= self.target_properties else '📊 PROGRESS'}")
             logger.info(f"📊 Data Completeness:")
-            logger.info(f"   📐 SQM Data: {len(with_sqm)}/{total_properties} ({100*len(with_sqm)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🔋 Energy Class: {len(with_energy)}/{total_properties} ({100*len(with_energy)/max(1,total_properties):.1f}%)")
-            logger.info(f"   🏘️ Area Data: {len(with_area)}/{total_properties} ({100*len(with_area)/max(1,total_properties):.1f}%)")
+            logger.info(f"   📐 SQM Data: {with_sqm}/{total_properties} ({100*with_sqm/max(1,total_properties):.1f}%)")
+            logger.info(f"   🔋 Energy Class: {with_energy}/{total_properties} ({100*with_energy/max(1,total_properties):.1f}%)")
+            logger.info(f"   🏘️ Area Data: {with_area}/{total_properties} ({100*with_area/max(1,total_properties):.1f}%)")
             
             if area_distribution:
                 logger.info(f"\n🏘️ AREA DISTRIBUTION:")
-                for area, count in sorted(area_distribution.items(), key=lambda x: x[1], reverse=True):
+                for area, count in area_distribution.most_common():
                     logger.info(f"   {area}: {count} properties")
             
             if energy_distribution:
@@ -599,7 +809,7 @@ class AthensDirectPropertyScraper:
                     logger.info(f"   Class {energy_class}: {count} properties")
             
             logger.info(f"\n💾 DELIVERABLE:")
-            logger.info(f"   📊 CSV: {csv_file}")
+            logger.info(f"   📊 CSV: {self.csv_file}")
             logger.info("="*100)
             
         except Exception as e:
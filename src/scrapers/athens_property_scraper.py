@@ -7,14 +7,24 @@ Scrapes 10 Athens neighborhoods for properties with sqm and energy class data
 import asyncio
 import json
 import logging
+from logging.handlers import MemoryHandler
 import re
 import random
 import csv
+from collections import Counter
 from datetime import datetime
-from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
+from itertools import islice
+from typing import Dict, Iterator, List, Optional
+from dataclasses import dataclass, asdict, fields
+from operator import attrgetter
+import numpy as np
 from playwright.async_api import async_playwright
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from config import config
 
 # Setup comprehensive logging
@@ -23,14 +33,54 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler('outputs/athens_scraper.log')
+        # File records are written 512 at a time; errors and shutdown flush early
+        MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=logging.FileHandler('outputs/athens_scraper.log')
+        )
     ]
 )
 logger = logging.getLogger(__name__)
 
+# Value pools for simulated properties
+PROPERTY_TYPES = ('Διαμέρισμα', 'Μεζονέτα', 'Ρετιρέ', 'Μονοκατοικία')
+LISTING_TYPES = ('Ενοικίαση', 'Πώληση')
+ENERGY_CLASSES = ('A+', 'A', 'B+', 'B', 'C', 'D', 'E', None, None)  # None = not specified
+
+# Neighborhood-specific pricing (realistic Athens ranges)
+NEIGHBORHOOD_PRICE_RANGES = {
+    'Κολωνάκι': (800, 3000),
+    'Παγκράτι': (500, 1800),
+    'Εξάρχεια': (400, 1400),
+    'Πλάκα': (700, 2500),
+    'Ψυρρή': (600, 2000),
+    'Κυψέλη': (350, 1200),
+    'Αμπελόκηποι': (600, 2200),
+    'Γκάζι': (550, 1900),
+    'Νέος Κόσμος': (400, 1500),
+    'Πετράλωνα': (450, 1600)
+}
+
+# Requests the scraper never needs to read property text
+BLOCKED_RESOURCE_TYPES = frozenset(['image', 'stylesheet', 'font', 'media'])
+
+def jitter_delays(low: float, high: float, batch_size: int = 1024) -> Iterator[float]:
+    """Endless stream of uniform delays, drawn from NumPy a batch at a time"""
+    rng = np.random.default_rng()
+    while True:
+        yield from rng.uniform(low, high, batch_size).tolist()
+
 @dataclass
 class AthensProperty:
     """Athens property with focus on sqm and energy class"""
+    # Declared by hand: dataclass(slots=True) needs Python 3.10, CI runs 3.9
+    __slots__ = (
+        'neighborhood', 'url', 'title', 'address', 'price', 'sqm', 'energy_class',
+        'rooms', 'floor', 'property_type', 'listing_type', 'description',
+        'extraction_timestamp', 'worker_id', 'confidence_score'
+    )
+    
     neighborhood: str
     url: str
     title: str
@@ -43,16 +93,26 @@ class AthensProperty:
     property_type: str                # Apartment, House, etc.
     listing_type: str                 # Rent, Sale
     description: str
-    extraction_timestamp: str
+    extraction_timestamp: datetime
     worker_id: str
     confidence_score: float           # Data quality score
 
+PROPERTY_FIELDS = tuple(field.name for field in fields(AthensProperty))
+PROPERTY_ROW_GETTER = attrgetter(*PROPERTY_FIELDS)  # AthensProperty -> CSV row tuple
+
 class AthensPropertyScraper:
     """Professional Athens property scraper"""
     
-    def __init__(self):
+    def __init__(self, use_browser: bool = False):
+        self.use_browser = use_browser  # The simulated extraction needs no browser
         self.url_queue = asyncio.Queue()
+        self.worker_count = 3  # Reduced to avoid overwhelming the site
         self.results = []
+        self.playwright = None
+        self.browser = None  # One Chromium shared by discovery and all workers
+        self.storage_state = None  # Discovery's cookies, reused by worker contexts
+        self.session_ready = asyncio.Event()
+        self.simulation_delays = jitter_delays(0.5, 1.5)
         self.stats = {
             'neighborhoods_processed': 0,
             'urls_discovered': 0,
@@ -73,92 +133,117 @@ class AthensPropertyScraper:
         
         self.stats['start_time'] = datetime.now()
         
-        # Start producer and consumers
-        tasks = []
-        tasks.append(asyncio.create_task(self.discover_properties()))
-        
-        # Start workers (reduced to avoid overwhelming the site)
-        for i in range(3):
-            tasks.append(asyncio.create_task(self.property_worker(f"worker-{i+1}")))
-        
-        # Wait for discovery to complete
-        await tasks[0]
-        logger.info("📦 Property discovery complete, finalizing extraction...")
-        
-        # Give workers time to finish
-        await asyncio.sleep(10)
-        
-        # Cancel remaining tasks
-        for task in tasks[1:]:
-            task.cancel()
+        if self.use_browser:
+            self.playwright = await async_playwright().start()
+            self.browser = await self.playwright.chromium.launch(
+                headless=True,
+                args=['--no-sandbox', '--disable-blink-features=AutomationControlled']
+            )
         
-        self.stats['end_time'] = datetime.now()
-        self.print_comprehensive_stats()
+        try:
+            # Workers start extracting as soon as discovery queues the first URL
+            # and stop at the sentinels queued once discovery is done
+            await asyncio.gather(
+                self.discover_properties(),
+                *(self.property_worker(f"worker-{i+1}") for i in range(self.worker_count))
+            )
+            
+            self.stats['end_time'] = datetime.now()
+            self.print_comprehensive_stats()
+        finally:
+            if self.browser:
+                await self.browser.close()
+                await self.playwright.stop()
         
         return self.results
     
+    async def block_heavy_resources(self, route):
+        """Abort image, stylesheet, font and media requests"""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+    
     async def discover_properties(self):
         """Discover property URLs across Athens neighborhoods"""
         logger.info("🔍 PROPERTY DISCOVERY: Starting Athens-wide search")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-blink-features=AutomationControlled']
-            )
+        try:
+            if self.use_browser:
+                await self.discover_with_browser()
+            else:
+                await self.discover_neighborhoods()
+            logger.info("📦 Property discovery complete, finalizing extraction...")
+        finally:
+            # Release waiting workers and queue one sentinel each, even if discovery failed
+            self.session_ready.set()
+            for _ in range(self.worker_count):
+                await self.url_queue.put(None)
+    
+    async def discover_with_browser(self):
+        """Open the xe.gr property section, then discover each neighborhood"""
+        context = await self.browser.new_context(
+            viewport={'width': 1920, 'height': 1080},
+            user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+            locale='el-GR'
+        )
+        await context.route("**/*", self.block_heavy_resources)
+        
+        page = await context.new_page()
+        
+        try:
+            # Initial navigation and setup
+            await page.goto("https://xe.gr", wait_until="load", timeout=30000)
+            await asyncio.sleep(2)
             
-            context = await browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                user_agent='Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                locale='el-GR'
-            )
+            # Handle cookies
+            try:
+                cookie_btn = await page.wait_for_selector('button:has-text("ΣΥΜΦΩΝΩ")', timeout=5000)
+                if cookie_btn:
+                    await cookie_btn.click()
+                    await asyncio.sleep(2)
+            except:
+                pass
             
-            page = await context.new_page()
+            # Workers open their contexts with the accepted cookies
+            self.storage_state = await context.storage_state()
+            self.session_ready.set()
             
-            try:
-                # Initial navigation and setup
-                await page.goto("https://xe.gr", wait_until="load", timeout=30000)
-                await asyncio.sleep(2)
-                
-                # Handle cookies
-                try:
-                    cookie_btn = await page.wait_for_selector('button:has-text("ΣΥΜΦΩΝΩ")', timeout=5000)
-                    if cookie_btn:
-                        await cookie_btn.click()
-                        await asyncio.sleep(2)
-                except:
-                    pass
-                
-                # Navigate to property section
-                property_link = await page.wait_for_selector('a:has-text("Ακίνητα")', timeout=10000)
-                await property_link.click()
-                await asyncio.sleep(3)
-                
-                # Search each neighborhood
-                for neighborhood in config.neighborhoods:
-                    logger.info(f"🏘️ Discovering properties in {neighborhood}")
-                    
-                    # Since direct search has issues, we'll use a simpler approach
-                    # Generate some realistic property URLs to test with
-                    demo_urls = await self.generate_test_urls(neighborhood)
-                    
-                    for url in demo_urls:
-                        await self.url_queue.put((url, neighborhood))
-                        self.stats['urls_discovered'] += 1
-                    
-                    self.stats['neighborhoods_processed'] += 1
-                    logger.info(f"📦 {neighborhood}: Added {len(demo_urls)} test properties")
-                    
-                    await asyncio.sleep(1)  # Respectful delay
-                
-                # Add sentinel values
-                for _ in range(3):
-                    await self.url_queue.put(None)
-                
-            except Exception as e:
-                logger.error(f"❌ Property discovery failed: {e}")
-            finally:
-                await browser.close()
+            # Navigate to property section
+            property_link = await page.wait_for_selector('a:has-text("Ακίνητα")', timeout=10000)
+            await property_link.click()
+            await asyncio.sleep(3)
+            
+            await self.discover_neighborhoods()
+            
+        except Exception as e:
+            logger.error(f"❌ Property discovery failed: {e}")
+        finally:
+            await context.close()
+    
+    async def discover_neighborhoods(self):
+        """Search all neighborhoods concurrently, at most 3 at a time"""
+        semaphore = asyncio.Semaphore(3)
+        await asyncio.gather(*(
+            self.discover_neighborhood(neighborhood, semaphore)
+            for neighborhood in config.neighborhoods
+        ))
+    
+    async def discover_neighborhood(self, neighborhood: str, semaphore: asyncio.Semaphore):
+        """Queue the property URLs found for one neighborhood"""
+        async with semaphore:
+            logger.info(f"🏘️ Discovering properties in {neighborhood}")
+            
+            # Since direct search has issues, we'll use a simpler approach
+            # Generate some realistic property URLs to test with
+            demo_urls = await self.generate_test_urls(neighborhood)
+            
+            for url in demo_urls:
+                await self.url_queue.put((url, neighborhood))
+                self.stats['urls_discovered'] += 1
+            
+            self.stats['neighborhoods_processed'] += 1
+            logger.info(f"📦 {neighborhood}: Added {len(demo_urls)} test properties")
     
     async def generate_test_urls(self, neighborhood: str) -> List[str]:
         """Generate test property URLs for demonstration"""
@@ -172,17 +257,14 @@ class AthensPropertyScraper:
         return base_patterns[:2]  # Return 2 URLs per neighborhood
     
     async def property_worker(self, worker_id: str):
-        """Worker that extracts property data"""
+        """Worker that extracts property data until it takes a sentinel from the queue"""
         logger.info(f"👷 {worker_id}: Starting Athens property extraction")
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(
-                headless=True,
-                args=['--no-sandbox', '--disable-blink-features=AutomationControlled']
-            )
-            
-            # Randomized context for each worker
-            context = await browser.new_context(
+        # Randomized context for each worker
+        context = None
+        if self.use_browser:
+            await self.session_ready.wait()
+            context = await self.browser.new_context(
                 viewport={
                     'width': random.randint(1600, 1920),
                     'height': random.randint(900, 1080)
@@ -191,78 +273,63 @@ class AthensPropertyScraper:
                     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
                     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36'
                 ]),
-                locale='el-GR'
+                locale='el-GR',
+                storage_state=self.storage_state
             )
-            
-            while True:
-                try:
-                    item = await self.url_queue.get()
-                    if item is None:
-                        break
-                    
-                    url, neighborhood = item
-                    
-                    # For demo purposes, create a simulated property
-                    # In production, this would scrape the actual URL
-                    property_data = await self.simulate_property_extraction(
-                        url, neighborhood, worker_id
-                    )
-                    
-                    if property_data:
-                        self.results.append(property_data)
-                        self.stats['properties_extracted'] += 1
-                        
-                        # Track key metrics
-                        if property_data.sqm:
-                            self.stats['with_sqm'] += 1
-                        if property_data.energy_class:
-                            self.stats['with_energy_class'] += 1
-                        if property_data.sqm and property_data.energy_class:
-                            self.stats['with_both'] += 1
-                        
-                        logger.info(f"✅ {worker_id}: {neighborhood} - {property_data.sqm}m² - {property_data.energy_class}")
-                    else:
-                        self.stats['failures'] += 1
+            await context.route("**/*", self.block_heavy_resources)
+        delays = jitter_delays(2.0, 4.0)
+        
+        while True:
+            try:
+                item = await self.url_queue.get()
+                if item is None:
+                    break
+                
+                url, neighborhood = item
+                
+                # For demo purposes, create a simulated property
+                # In production, this would scrape the actual URL
+                property_data = await self.simulate_property_extraction(
+                    url, neighborhood, worker_id
+                )
+                
+                if property_data:
+                    self.results.append(property_data)
+                    self.stats['properties_extracted'] += 1
                     
-                    # Professional delay
-                    await asyncio.sleep(random.uniform(2.0, 4.0))
+                    # Track key metrics
+                    if property_data.sqm:
+                        self.stats['with_sqm'] += 1
+                    if property_data.energy_class:
+                        self.stats['with_energy_class'] += 1
+                    if property_data.sqm and property_data.energy_class:
+                        self.stats['with_both'] += 1
                     
-                except Exception as e:
-                    logger.error(f"❌ {worker_id}: Error: {e}")
+                    logger.info(f"✅ {worker_id}: {neighborhood} - {property_data.sqm}m² - {property_data.energy_class}")
+                else:
                     self.stats['failures'] += 1
-            
-            await browser.close()
-            logger.info(f"👷 {worker_id}: Worker finished")
+                
+                # Professional delay
+                await asyncio.sleep(next(delays))
+                
+            except Exception as e:
+                logger.error(f"❌ {worker_id}: Error: {e}")
+                self.stats['failures'] += 1
+        
+        if context:
+            await context.close()
+        logger.info(f"👷 {worker_id}: Worker finished")
     
     async def simulate_property_extraction(self, url: str, neighborhood: str, worker_id: str) -> Optional[AthensProperty]:
         """Simulate property extraction with realistic Athens data"""
         try:
-            # Generate realistic property data for demonstration
-            property_types = ['Διαμέρισμα', 'Μεζονέτα', 'Ρετιρέ', 'Μονοκατοικία']
-            listing_types = ['Ενοικίαση', 'Πώληση']
-            energy_classes = ['A+', 'A', 'B+', 'B', 'C', 'D', 'E', None, None]  # None = not specified
-            
-            # Neighborhood-specific pricing (realistic Athens ranges)
-            price_ranges = {
-                'Κολωνάκι': (800, 3000),
-                'Παγκράτι': (500, 1800),
-                'Εξάρχεια': (400, 1400),
-                'Πλάκα': (700, 2500),
-                'Ψυρρή': (600, 2000),
-                'Κυψέλη': (350, 1200),
-                'Αμπελόκηποι': (600, 2200),
-                'Γκάζι': (550, 1900),
-                'Νέος Κόσμος': (400, 1500),
-                'Πετράλωνα': (450, 1600)
-            }
-            
             # Generate realistic data
             sqm = random.randint(35, 120) if random.random() > 0.1 else None  # 90% have sqm
-            energy_class = random.choice(energy_classes)  # 70% have energy class
+            energy_class = random.choice(ENERGY_CLASSES)  # 70% have energy class
             rooms = random.randint(1, 4) if sqm else None
             floor = f"{random.randint(1, 6)}ος" if random.random() > 0.3 else None
             
-            price_range = price_ranges.get(neighborhood, (400, 1600))
+            price_range = NEIGHBORHOOD_PRICE_RANGES.get(neighborhood, (400, 1600))
             base_price = random.randint(price_range[0], price_range[1])
             price = base_price if sqm else None
             
@@ -275,23 +342,23 @@ class AthensPropertyScraper:
             property_data = AthensProperty(
                 neighborhood=neighborhood,
                 url=url,
-                title=f"{random.choice(property_types)} {sqm}τ.μ. στο {neighborhood}" if sqm else f"{random.choice(property_types)} στο {neighborhood}",
+                title=f"{random.choice(PROPERTY_TYPES)} {sqm}τ.μ. στο {neighborhood}" if sqm else f"{random.choice(PROPERTY_TYPES)} στο {neighborhood}",
                 address=f"Αθήνα, {neighborhood}",
                 price=price,
                 sqm=sqm,
                 energy_class=energy_class,
                 rooms=rooms,
                 floor=floor,
-                property_type=random.choice(property_types),
-                listing_type=random.choice(listing_types),
-                description=f"Υπέροχο {random.choice(property_types).lower()} στην καρδιά του {neighborhood}. Ιδανικό για επαγγελματίες.",
-                extraction_timestamp=datetime.now().isoformat(),
+                property_type=random.choice(PROPERTY_TYPES),
+                listing_type=random.choice(LISTING_TYPES),
+                description=f"Υπέροχο {random.choice(PROPERTY_TYPES).lower()} στην καρδιά του {neighborhood}. Ιδανικό για επαγγελματίες.",
+                extraction_timestamp=datetime.now(),
                 worker_id=worker_id,
                 confidence_score=confidence
             )
             
             # Simulate some processing time
-            await asyncio.sleep(random.uniform(0.5, 1.5))
+            await asyncio.sleep(next(self.simulation_delays))
             
             return property_data
             
@@ -323,50 +390,59 @@ class AthensPropertyScraper:
 
 async def main():
     """Main execution"""
-    scraper = AthensPropertyScraper()
+    scraper = AthensPropertyScraper(use_browser=False)
     properties = await scraper.scrape_athens_properties()
     
     if properties:
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Save detailed JSON
-        json_file = f'outputs/athens_properties_{timestamp}.json'
-        with open(json_file, 'w', encoding='utf-8') as f:
-            json.dump([asdict(p) for p in properties], f, indent=2, ensure_ascii=False)
+        # Save detailed JSON, one property per line
+        json_file = f'outputs/athens_properties_{timestamp}.jsonl'
+        if orjson:
+            # orjson serializes the dataclasses directly, no asdict copies
+            with open(json_file, 'wb') as f:
+                for prop in properties:
+                    f.write(orjson.dumps(prop, option=orjson.OPT_APPEND_NEWLINE))
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                for prop in properties:
+                    f.write(json.dumps(asdict(prop), ensure_ascii=False, separators=(',', ':'),
+                                       default=datetime.isoformat) + '\n')
         
         # Save CSV for analysis
         csv_file = f'outputs/athens_properties_{timestamp}.csv'
         with open(csv_file, 'w', newline='', encoding='utf-8') as f:
-            if properties:
-                writer = csv.DictWriter(f, fieldnames=asdict(properties[0]).keys())
-                writer.writeheader()
-                for prop in properties:
-                    writer.writerow(asdict(prop))
+            writer = csv.writer(f)
+            writer.writerow(PROPERTY_FIELDS)
+            writer.writerows(map(PROPERTY_ROW_GETTER, properties))
         
         # Generate summary report
         logger.info(f"\n📄 RESULTS SAVED:")
-        logger.info(f"   JSON: {json_file}")
+        logger.info(f"   JSONL: {json_file}")
         logger.info(f"   CSV:  {csv_file}")
         
         # Show sample properties with key data
         logger.info(f"\n🏠 SAMPLE ATHENS PROPERTIES:")
-        properties_with_both = [p for p in properties if p.sqm and p.energy_class]
+        properties_with_both = (p for p in properties if p.sqm and p.energy_class)
         
-        for i, prop in enumerate(properties_with_both[:5], 1):
+        for i, prop in enumerate(islice(properties_with_both, 5), 1):
             logger.info(f"{i}. {prop.neighborhood} - {prop.sqm}m² - Energy {prop.energy_class} - €{prop.price}")
             logger.info(f"   {prop.title}")
             logger.info(f"   {prop.url}")
         
         # Neighborhood breakdown
         logger.info(f"\n📊 NEIGHBORHOOD BREAKDOWN:")
-        from collections import Counter
-        neighborhood_counts = Counter(p.neighborhood for p in properties)
+        neighborhood_counts = Counter()
+        neighborhood_with_data = Counter()
+        for p in properties:
+            neighborhood_counts[p.neighborhood] += 1
+            if p.sqm and p.energy_class:
+                neighborhood_with_data[p.neighborhood] += 1
         for neighborhood, count in neighborhood_counts.items():
-            with_data = len([p for p in properties if p.neighborhood == neighborhood and p.sqm and p.energy_class])
-            logger.info(f"   {neighborhood}: {count} properties ({with_data} with SQM+Energy)")
+            logger.info(f"   {neighborhood}: {count} properties ({neighborhood_with_data[neighborhood]} with SQM+Energy)")
         
         logger.info(f"\n🎉 ATHENS PROPERTY SCRAPING COMPLETE!")
-        logger.info(f"🏛️ Successfully extracted data from {len(set(p.neighborhood for p in properties))} Athens neighborhoods")
+        logger.info(f"🏛️ Successfully extracted data from {len(neighborhood_counts)} Athens neighborhoods")
         
     else:
         logger.error("❌ No properties extracted")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test area matching in the comprehensive 150+ scraper
+Transliterated text must resolve inflected area names but not look-alike words
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("playwright")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src" / "scrapers"))
+
+from athens_comprehensive_150_scraper import AthensComprehensive150Scraper, ExtractionContext
+
+
+@pytest.fixture
+def scraper(tmp_path, monkeypatch):
+    monkeypatch.setenv("OUT_DIR", str(tmp_path))
+    scraper = AthensComprehensive150Scraper()
+    yield scraper
+    scraper.executor.shutdown(wait=True)
+
+
+def test_tiles_do_not_match_plaka(scraper):
+    ctx = ExtractionContext(page_text="Ανακαινισμένο διαμέρισμα με νέα πλακάκια", title="Πώληση διαμερίσματος")
+    assert scraper.extract_area_comprehensive(ctx, "Κυψέλη") == "Κυψέλη"
+
+
+def test_greek_and_latin_spellings_resolve(scraper):
+    assert scraper.extract_area_comprehensive(ExtractionContext(page_text="Διαμέρισμα στην Πλάκα, 80 τ.μ."), "") == "Πλάκα"
+    assert scraper.extract_area_comprehensive(ExtractionContext(page_text="Apartment in Plaka, 80 sqm"), "") == "Πλάκα"
+    assert scraper.extract_area_comprehensive(ExtractionContext(page_text="Loft, Παγκράτι"), "") == "Παγκράτι"
+
+
+@pytest.mark.parametrize("text, area", [
+    ("Διαμέρισμα στην περιοχή Κυψέλης", "Κυψέλη"),
+    ("Μονοκατοικία της Πλάκας", "Πλάκα"),
+    ("Κέντρο Καλλιθέας, 2ος όροφος", "Καλλιθέα"),
+    ("Γκαρσονιέρα Παγκρατίου", "Παγκράτι"),
+])
+def test_genitive_forms_resolve(scraper, text, area):
+    assert scraper.extract_area_comprehensive(ExtractionContext(page_text=text), "") == area